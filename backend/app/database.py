@@ -15,17 +15,49 @@ Environment Variables:
 - DATABASE_URL: Full connection string (preferred for production)
 - DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD: Individual components
 
-Connection Pool Settings:
-- pool_size: Number of connections to keep open (default: 5)
-- max_overflow: Additional connections allowed during peak load (default: 10)
+Connection Pool Settings (overridable through environment variables):
+- DB_POOL_SIZE: Number of connections to keep open (default: 10)
+- DB_MAX_OVERFLOW: Additional connections allowed during peak load (default: 10)
+- DB_POOL_TIMEOUT: Seconds to wait for a free connection (default: 30)
+- DB_POOL_RECYCLE: Seconds after which a pooled connection is replaced
+  (default: 1800), so connections silently dropped by firewalls or
+  load balancers are not handed out
 - pool_pre_ping: Test connections before use to handle stale connections
+- warm_pool(): Opens DB_POOL_SIZE connections at startup so the first
+  requests after a deploy do not pay for the connection handshake
+
+Every API request is a short, database-bound call, so throughput under
+load is set by how many requests can hold a connection at once. Size
+DB_POOL_SIZE + DB_MAX_OVERFLOW per worker process and keep
+workers x (DB_POOL_SIZE + DB_MAX_OVERFLOW) below PostgreSQL's
+max_connections (100 by default), leaving room for admin sessions.
+
+Statement Cache:
+- DB_QUERY_CACHE_SIZE: Compiled statements kept in SQLAlchemy's compile
+  cache (default: 1200). Statements built with select() and plain
+  Python values reuse their compiled SQL across requests; with SQL_ECHO
+  enabled, hits are logged as "[cached since ...]". Raise the size if
+  the log shows "[generated in ...]" for statements that repeat.
+
+Running Behind PgBouncer:
+When DATABASE_URL points at PgBouncer in transaction pooling mode (see the
+optional pgbouncer service in docker-compose.yml), keep the in-process pool
+small, e.g. DB_POOL_SIZE=5 and DB_MAX_OVERFLOW=0, so that
+workers x pool size stays within PgBouncer's default_pool_size. Excess
+requests then queue inside PgBouncer instead of blocking Python threads.
+
+Query Counting:
+- count_queries(): Context manager collecting the SQL statements executed
+  in the current context, used to catch N+1 regressions
 """
 
 import os
-from sqlalchemy import create_engine
+from contextlib import contextmanager
+from contextvars import ContextVar
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from typing import Generator
+from typing import Generator, Iterator, List, Optional
 
 
 def get_database_url() -> str:
@@ -57,16 +89,82 @@ def get_database_url() -> str:
 # Database URL
 DATABASE_URL = get_database_url()
 
+# Connection pool sizing
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+# Compiled statement cache size (SQLAlchemy default is 500)
+DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))
+
 # SQLAlchemy engine with connection pool configuration
-# pool_pre_ping helps recover from database restarts
+# pool_pre_ping helps recover from database restarts, pool_recycle retires
+# connections before idle timeouts on the network path can break them
 engine = create_engine(
     DATABASE_URL,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
     pool_pre_ping=True,
+    query_cache_size=DB_QUERY_CACHE_SIZE,
     echo=os.getenv("SQL_ECHO", "false").lower() == "true"  # SQL logging for debug
 )
 
+def warm_pool(size: int = DB_POOL_SIZE) -> None:
+    """
+    Fill the connection pool with up to ``size`` open connections.
+
+    All connections are checked out at once, verified with SELECT 1 and
+    then returned, so the pool keeps them for the first requests instead
+    of opening them on demand. Raises if the database is unreachable.
+    """
+    connections = []
+    try:
+        for _ in range(size):
+            conn = engine.connect()
+            connections.append(conn)
+            conn.execute(text("SELECT 1"))
+    finally:
+        for conn in connections:
+            conn.close()
+
+
+# Statements executed while a count_queries() block is active.
+# A ContextVar keeps concurrent requests from seeing each other's queries.
+_query_log: ContextVar[Optional[List[str]]] = ContextVar("query_log", default=None)
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _record_query(conn, cursor, statement, parameters, context, executemany):
+    """Append each statement to the active query log, if any."""
+    query_log = _query_log.get()
+    if query_log is not None:
+        query_log.append(statement)
+
+
+@contextmanager
+def count_queries() -> Iterator[List[str]]:
+    """
+    Collect the SQL statements executed inside the block.
+
+    Usage:
+        with count_queries() as queries:
+            client.get("/api/catalysts/?include=method")
+        assert len(queries) <= 2
+
+    Yields:
+        List[str]: Statements in execution order (filled in as they run)
+    """
+    query_log: List[str] = []
+    token = _query_log.set(query_log)
+    try:
+        yield query_log
+    finally:
+        _query_log.reset(token)
+
+
 # Session factory
 # autocommit=False: Explicit transaction control
 # autoflush=False: Manual flush for better control over when changes are sent
@@ -92,6 +190,9 @@ def get_db() -> Generator:
     
     The session is automatically closed after the request completes,
     even if an exception occurs. This prevents connection leaks.
+    Uncommitted work is rolled back explicitly on errors, so the
+    connection goes back to the pool (or PgBouncer) with no open
+    transaction.
     
     Yields:
         Session: SQLAlchemy database session
@@ -99,6 +200,9 @@ def get_db() -> Generator:
     db = SessionLocal()
     try:
         yield db
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
 
@@ -123,7 +227,7 @@ def init_db():
     from app.models.catalysts.chemical import Chemical
     from app.models.catalysts.method import Method, UserMethod
     from app.models.catalysts.support import Support
-    from app.models.catalysts.catalyst import Catalyst
+    from app.models.catalysts.catalyst import Catalyst, CatalystConsumption
     from app.models.catalysts.sample import Sample
 
     # Analysis
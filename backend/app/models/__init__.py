@@ -63,6 +63,7 @@ from app.models.catalysts.method import Method, UserMethod, chemical_method
 from app.models.catalysts.support import Support
 from app.models.catalysts.catalyst import (
     Catalyst,
+    CatalystConsumption,
     catalyst_catalyst,
     catalyst_characterization,
     catalyst_observation,
@@ -122,6 +123,7 @@ __all__ = [
     "UserMethod",
     "Support",
     "Catalyst",
+    "CatalystConsumption",
     "Sample",
 
     # Analysis
@@ -8,6 +8,7 @@ This domain contains models related to catalyst synthesis and inventory:
 - Chemical: Chemical compounds used in synthesis
 - Support: Substrate materials for supported catalysts
 - UserMethod: Method modification history (association model)
+- CatalystConsumption: Catalyst material consumption log
 
 Junction tables in this domain:
 - chemical_method: Links methods to chemicals
@@ -26,6 +27,7 @@ from app.models.catalysts.method import Method, UserMethod, chemical_method
 from app.models.catalysts.support import Support
 from app.models.catalysts.catalyst import (
     Catalyst,
+    CatalystConsumption,
     catalyst_catalyst,
     catalyst_characterization,
     catalyst_observation,
@@ -46,6 +48,7 @@ __all__ = [
     "UserMethod",
     "Support",
     "Catalyst",
+    "CatalystConsumption",
     "Sample",
     # Junction tables (exported for reference/queries)
     "chemical_method",
@@ -16,12 +16,17 @@ Phase 2 Additions:
 - samples relationship: Track samples prepared from this catalyst
 - characterizations relationship: Link to analytical characterizations
 - observations relationship: Link to qualitative observations
+
+Consumption Log:
+- CatalystConsumption records every material withdrawal as its own row,
+  so inventory history is queryable without parsing the notes column
 """
 
-from sqlalchemy import Column, Integer, String, Numeric, Text, DateTime, ForeignKey, Table, CheckConstraint
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Numeric, Text, DateTime, ForeignKey, Table, CheckConstraint, Index, select
+from sqlalchemy.orm import relationship, backref, column_property
 from sqlalchemy.sql import func
 from app.database import Base
+from app.models.catalysts.sample import Sample
 
 
 # Junction table for catalyst derivation relationships
@@ -96,6 +101,22 @@ class Catalyst(Base):
 
     __tablename__ = "catalysts"
 
+    __table_args__ = (
+        # Inventory invariant, enforced by the database for every writer
+        CheckConstraint(
+            'remaining_amount <= yield',
+            name='check_catalyst_remaining_within_yield'
+        ),
+        # Trigram index (pg_trgm) lets name search with ILIKE '%term%'
+        # use an index instead of scanning the whole table
+        Index(
+            'idx_catalysts_name_trgm',
+            'name',
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'}
+        ),
+    )
+
     # Primary key
     id = Column(Integer, primary_key=True, autoincrement=True)
 
@@ -151,6 +172,34 @@ class Catalyst(Base):
         nullable=False
     )
 
+    # =========================================================================
+    # Aggregates
+    # =========================================================================
+
+    # Counts are computed in SQL as correlated subqueries so that serializing
+    # a catalyst never has to load its samples or characterizations. They
+    # are deferred as one group and only undeferred (undefer_group('counts'))
+    # by the routes that return CatalystResponse or CatalystListItem.
+    sample_count = column_property(
+        select(func.count(Sample.id))
+        .where(Sample.catalyst_id == id)
+        .correlate_except(Sample)
+        .scalar_subquery(),
+        deferred=True,
+        group='counts',
+        doc="Number of samples prepared from this catalyst"
+    )
+
+    characterization_count = column_property(
+        select(func.count(catalyst_characterization.c.characterization_id))
+        .where(catalyst_characterization.c.catalyst_id == id)
+        .correlate_except(catalyst_characterization)
+        .scalar_subquery(),
+        deferred=True,
+        group='counts',
+        doc="Number of characterizations performed on this catalyst"
+    )
+
     # =========================================================================
     # Relationships
     # =========================================================================
@@ -162,6 +211,10 @@ class Catalyst(Base):
         doc="Synthesis method used to create this catalyst"
     )
 
+    # Junction rows for the many-to-many relationships below are removed by
+    # ON DELETE CASCADE (passive_deletes), so deleting a catalyst does not
+    # load each collection just to delete its links row by row.
+
     # Self-referential many-to-many for catalyst derivation chains
     # input_catalysts: catalysts used to create this one
     # output_catalysts: catalysts created from this one
@@ -170,7 +223,8 @@ class Catalyst(Base):
         secondary=catalyst_catalyst,
         primaryjoin=(id == catalyst_catalyst.c.output_catalyst_id),
         secondaryjoin=(id == catalyst_catalyst.c.input_catalyst_id),
-        backref="output_catalysts",
+        backref=backref("output_catalysts", passive_deletes=True),
+        passive_deletes=True,
         doc="Catalysts that were used as inputs to create this catalyst"
     )
 
@@ -187,6 +241,7 @@ class Catalyst(Base):
         "Characterization",
         secondary=catalyst_characterization,
         back_populates="catalysts",
+        passive_deletes=True,
         doc="Analytical characterizations performed on this catalyst"
     )
 
@@ -195,6 +250,7 @@ class Catalyst(Base):
         "Observation",
         secondary=catalyst_observation,
         back_populates="catalysts",
+        passive_deletes=True,
         doc="Qualitative observations about this catalyst"
     )
 
@@ -203,9 +259,21 @@ class Catalyst(Base):
         "User",
         secondary=user_catalyst,
         back_populates="catalysts",
+        passive_deletes=True,
         doc="Users who have worked on this catalyst"
     )
 
+    # One-to-many: Material consumption log entries
+    # Rows are removed by the database (ON DELETE CASCADE), so the ORM
+    # never has to load the log just to delete a catalyst
+    consumptions = relationship(
+        "CatalystConsumption",
+        back_populates="catalyst",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        doc="Material consumption log for this catalyst"
+    )
+
     def __repr__(self):
         """String representation for debugging."""
         return f"<Catalyst(id={self.id}, name='{self.name}', remaining={self.remaining_amount})>"
@@ -223,12 +291,75 @@ class Catalyst(Base):
         used = float(self.yield_amount) - float(self.remaining_amount)
         return (used / float(self.yield_amount)) * 100
 
-    @property
-    def sample_count(self) -> int:
-        """Number of samples prepared from this catalyst."""
-        return len(self.samples) if self.samples else 0
 
-    @property
-    def characterization_count(self) -> int:
-        """Number of characterizations performed on this catalyst."""
-        return len(self.characterizations) if self.characterizations else 0
+# B-tree on lower(name) for prefix search: lower(name) LIKE 'term%' is an
+# index range scan. text_pattern_ops makes LIKE usable regardless of the
+# database collation. Declared after the class so it can use the mapped column.
+Index(
+    'idx_catalysts_name_lower_prefix',
+    func.lower(Catalyst.name).label('name_lower'),
+    postgresql_ops={'name_lower': 'text_pattern_ops'}
+)
+
+# Matches the list ordering (newest first, id as tie-breaker) so keyset
+# pagination on (created_at, id) is an index range scan
+Index(
+    'idx_catalysts_created_at_id',
+    Catalyst.created_at.desc(),
+    Catalyst.id.desc()
+)
+
+
+class CatalystConsumption(Base):
+    """
+    Log entry for material consumed from a catalyst's inventory.
+
+    Each call to the consume endpoint records one row with the amount
+    withdrawn and an optional note. Keeping the log in its own table
+    means the history is append-only and indexed per catalyst, instead
+    of living only in the catalyst's free-text notes.
+    """
+
+    __tablename__ = "catalyst_consumptions"
+
+    __table_args__ = (
+        # Serves "latest consumptions for a catalyst" directly from the index
+        Index(
+            'idx_catalyst_consumptions_catalyst_consumed_at',
+            'catalyst_id',
+            'consumed_at'
+        ),
+    )
+
+    # Primary key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Catalyst the material was taken from
+    catalyst_id = Column(
+        Integer,
+        ForeignKey('catalysts.id', ondelete='CASCADE'),
+        nullable=False
+    )
+
+    # Amount consumed (grams), same precision as the inventory columns
+    amount = Column(
+        Numeric(8, 4),
+        CheckConstraint('amount > 0', name='check_catalyst_consumption_amount_positive'),
+        nullable=False
+    )
+
+    # Optional note on what the material was used for
+    notes = Column(Text, nullable=True)
+
+    # When the material was consumed
+    consumed_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+
+    # Relationship to parent catalyst
+    catalyst = relationship("Catalyst", back_populates="consumptions")
+
+    def __repr__(self):
+        return f"<CatalystConsumption(id={self.id}, catalyst_id={self.catalyst_id}, amount={self.amount})>"
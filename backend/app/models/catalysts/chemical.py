@@ -23,8 +23,8 @@ Design Notes:
   formulas, or safety data could be added via schema migration if needed
 """
 
-from sqlalchemy import Column, Integer, String, DateTime
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, Index, select
+from sqlalchemy.orm import relationship, column_property
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -55,6 +55,17 @@ class Chemical(Base):
 
     __tablename__ = "chemicals"
 
+    __table_args__ = (
+        # Trigram index (pg_trgm) lets name search with ILIKE '%term%'
+        # use an index instead of scanning the whole table
+        Index(
+            'idx_chemicals_name_trgm',
+            'name',
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'}
+        ),
+    )
+
     # Primary key
     id = Column(Integer, primary_key=True, autoincrement=True)
 
@@ -76,6 +87,23 @@ class Chemical(Base):
         nullable=False
     )
 
+    # =========================================================================
+    # Aggregates
+    # =========================================================================
+
+    # Computed in SQL as a correlated subquery so that serializing a chemical
+    # never loads its methods. Deferred like Method's counts: routes that
+    # return ChemicalResponse undefer it with undefer_group('counts').
+    method_count = column_property(
+        select(func.count(chemical_method.c.method_id))
+        .where(chemical_method.c.chemical_id == id)
+        .correlate_except(chemical_method)
+        .scalar_subquery(),
+        deferred=True,
+        group='counts',
+        doc="Number of methods that use this chemical"
+    )
+
     # =========================================================================
     # Relationships
     # =========================================================================
@@ -92,12 +120,26 @@ class Chemical(Base):
         """String representation for debugging."""
         return f"<Chemical(id={self.id}, name='{self.name}')>"
 
-    @property
-    def method_count(self) -> int:
-        """Number of methods that use this chemical."""
-        return len(self.methods) if self.methods else 0
-
     @property
     def is_in_use(self) -> bool:
         """Check if any methods reference this chemical."""
         return self.method_count > 0
+
+
+# B-tree on lower(name) for prefix search: lower(name) LIKE 'term%' is an
+# index range scan. text_pattern_ops makes LIKE usable regardless of the
+# database collation. Declared after the class so it can use the mapped column.
+Index(
+    'idx_chemicals_name_lower_prefix',
+    func.lower(Chemical.name).label('name_lower'),
+    postgresql_ops={'name_lower': 'text_pattern_ops'}
+)
+
+# Names are unique regardless of case and surrounding whitespace, so
+# "Ethanol" and "ethanol " cannot both exist. Enforced by the database;
+# the routers map the resulting IntegrityError to a 400.
+Index(
+    'idx_chemicals_name_normalized_unique',
+    func.lower(func.trim(Chemical.name)),
+    unique=True
+)
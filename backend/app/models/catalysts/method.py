@@ -11,10 +11,12 @@ Phase 2 Additions:
 - user_method relationship: Track method modification history with notes
 """
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Table, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Table, ForeignKey, Index, select
+from sqlalchemy.orm import relationship, column_property
 from sqlalchemy.sql import func
 from app.database import Base
+from app.models.catalysts.catalyst import Catalyst
+from app.models.catalysts.sample import Sample
 
 
 # Junction table for the many-to-many relationship between methods and chemicals
@@ -24,7 +26,9 @@ chemical_method = Table(
     'chemical_method',
     Base.metadata,
     Column('method_id', Integer, ForeignKey('methods.id', ondelete='CASCADE'), primary_key=True),
-    Column('chemical_id', Integer, ForeignKey('chemicals.id', ondelete='CASCADE'), primary_key=True)
+    Column('chemical_id', Integer, ForeignKey('chemicals.id', ondelete='CASCADE'), primary_key=True),
+    # The primary key leads with method_id; lookups by chemical need their own index
+    Index('idx_chemical_method_chemical_id', 'chemical_id')
 )
 
 
@@ -64,12 +68,12 @@ class UserMethod(Base):
         index=True
     )
 
-    # Foreign key to method that was modified
+    # Foreign key to method that was modified; indexed by the
+    # (method_id, changed_at, id) index declared below the classes
     method_id = Column(
         Integer,
         ForeignKey('methods.id', ondelete='CASCADE'),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Timestamp of when the change was made
@@ -112,6 +116,23 @@ class Method(Base):
 
     __tablename__ = "methods"
 
+    __table_args__ = (
+        # Trigram indexes (pg_trgm) let search with ILIKE '%term%' on
+        # either text column use an index instead of scanning the table
+        Index(
+            'idx_methods_descriptive_name_trgm',
+            'descriptive_name',
+            postgresql_using='gin',
+            postgresql_ops={'descriptive_name': 'gin_trgm_ops'}
+        ),
+        Index(
+            'idx_methods_procedure_trgm',
+            'procedure',
+            postgresql_using='gin',
+            postgresql_ops={'procedure': 'gin_trgm_ops'}
+        ),
+    )
+
     # Primary key
     id = Column(Integer, primary_key=True, autoincrement=True)
 
@@ -143,6 +164,55 @@ class Method(Base):
         nullable=False
     )
 
+    # =========================================================================
+    # Aggregates
+    # =========================================================================
+
+    # Counts are computed in SQL as correlated subqueries so that serializing
+    # a method, or checking whether it is in use, never loads the collections.
+    # They are deferred as one group: routes that return MethodResponse
+    # undefer them with undefer_group('counts'), while other loads of a
+    # method (nested includes, existence checks) skip the subqueries.
+    chemical_count = column_property(
+        select(func.count(chemical_method.c.chemical_id))
+        .where(chemical_method.c.method_id == id)
+        .correlate_except(chemical_method)
+        .scalar_subquery(),
+        deferred=True,
+        group='counts',
+        doc="Number of chemicals used in this method"
+    )
+
+    catalyst_count = column_property(
+        select(func.count(Catalyst.id))
+        .where(Catalyst.method_id == id)
+        .correlate_except(Catalyst)
+        .scalar_subquery(),
+        deferred=True,
+        group='counts',
+        doc="Number of catalysts created with this method"
+    )
+
+    sample_count = column_property(
+        select(func.count(Sample.id))
+        .where(Sample.method_id == id)
+        .correlate_except(Sample)
+        .scalar_subquery(),
+        deferred=True,
+        group='counts',
+        doc="Number of samples prepared with this method"
+    )
+
+    modification_count = column_property(
+        select(func.count(UserMethod.id))
+        .where(UserMethod.method_id == id)
+        .correlate_except(UserMethod)
+        .scalar_subquery(),
+        deferred=True,
+        group='counts',
+        doc="Number of recorded modifications to this method"
+    )
+
     # =========================================================================
     # Relationships
     # =========================================================================
@@ -182,27 +252,36 @@ class Method(Base):
         """String representation for debugging."""
         return f"<Method(id={self.id}, name='{self.descriptive_name}', active={self.is_active})>"
 
-    @property
-    def chemical_count(self) -> int:
-        """Number of chemicals used in this method."""
-        return len(self.chemicals) if self.chemicals else 0
-
-    @property
-    def catalyst_count(self) -> int:
-        """Number of catalysts created with this method."""
-        return len(self.catalysts) if self.catalysts else 0
-
-    @property
-    def sample_count(self) -> int:
-        """Number of samples prepared with this method."""
-        return len(self.samples) if self.samples else 0
-
     @property
     def is_in_use(self) -> bool:
         """Check if this method is used by any catalysts or samples."""
         return self.catalyst_count > 0 or self.sample_count > 0
 
-    @property
-    def modification_count(self) -> int:
-        """Number of recorded modifications to this method."""
-        return len(self.user_changes) if self.user_changes else 0
+
+# Matches the list ordering (newest first, id as tie-breaker) so keyset
+# pagination on (created_at, id) is an index range scan
+Index(
+    'idx_methods_created_at_id',
+    Method.created_at.desc(),
+    Method.id.desc()
+)
+
+# Same ordering behind the is_active filter, so "active methods, newest
+# first" is served from one index range without a sort
+Index(
+    'idx_methods_active_created_at_id',
+    Method.is_active,
+    Method.created_at.desc(),
+    Method.id.desc()
+)
+
+# A method's history newest first, so get_method_history and its keyset
+# cursor on (changed_at, id) read one index range without a sort. The
+# method_id prefix also serves Method.modification_count, so there is no
+# separate single-column index
+Index(
+    'idx_user_method_method_changed_at_id',
+    UserMethod.method_id,
+    UserMethod.changed_at.desc(),
+    UserMethod.id.desc()
+)
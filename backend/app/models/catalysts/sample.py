@@ -27,7 +27,7 @@ Relationships:
 - Many-to-many with User (audit tracking via user_sample)
 """
 
-from sqlalchemy import Column, Integer, String, Numeric, Text, DateTime, ForeignKey, Table, CheckConstraint
+from sqlalchemy import FetchedValue, Column, Integer, String, Numeric, Text, DateTime, ForeignKey, Table, CheckConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -100,6 +100,10 @@ class Sample(Base):
 
     __tablename__ = "samples"
 
+    # Fetch server-generated values (id, timestamps) with RETURNING during
+    # the flush instead of with a separate SELECT afterwards
+    __mapper_args__ = {'eager_defaults': True}
+
     # Primary key
     id = Column(Integer, primary_key=True, autoincrement=True)
 
@@ -114,8 +118,7 @@ class Sample(Base):
     catalyst_id = Column(
         Integer,
         ForeignKey('catalysts.id', ondelete='SET NULL'),
-        nullable=True,
-        index=True
+        nullable=True
     )
 
     # Foreign key to the support material
@@ -123,8 +126,7 @@ class Sample(Base):
     support_id = Column(
         Integer,
         ForeignKey('supports.id', ondelete='SET NULL'),
-        nullable=True,
-        index=True
+        nullable=True
     )
 
     # Foreign key to the preparation method
@@ -132,8 +134,7 @@ class Sample(Base):
     method_id = Column(
         Integer,
         ForeignKey('methods.id', ondelete='SET NULL'),
-        nullable=True,
-        index=True
+        nullable=True
     )
 
     # Amount of sample material produced (in grams typically)
@@ -168,9 +169,11 @@ class Sample(Base):
         nullable=False
     )
 
+    # Set by the update_updated_at_column trigger on every UPDATE
     updated_at = Column(
         DateTime(timezone=True),
         server_default=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False
     )
 
@@ -273,3 +276,59 @@ class Sample(Base):
     def experiment_count(self) -> int:
         """Count of experiments this sample has been used in."""
         return len(self.experiments) if self.experiments else 0
+
+
+# Matches the list ordering (newest first, id as tie-breaker) so keyset
+# pagination on (created_at, id) is an index range scan
+Index(
+    'idx_samples_created_at_id',
+    Sample.created_at.desc(),
+    Sample.id.desc()
+)
+
+# Filtered lists (by catalyst, support or method, newest first) read these
+# in order instead of sorting the matches; the leading column also serves
+# foreign key lookups, so the FK columns need no index of their own
+Index(
+    'idx_samples_catalyst_created_at_id',
+    Sample.catalyst_id,
+    Sample.created_at.desc(),
+    Sample.id.desc()
+)
+
+Index(
+    'idx_samples_support_created_at_id',
+    Sample.support_id,
+    Sample.created_at.desc(),
+    Sample.id.desc()
+)
+
+Index(
+    'idx_samples_method_created_at_id',
+    Sample.method_id,
+    Sample.created_at.desc(),
+    Sample.id.desc()
+)
+
+# Partial index for the common depleted=false filter
+Index(
+    'idx_samples_available_created_at_id',
+    Sample.created_at.desc(),
+    Sample.id.desc(),
+    postgresql_where=Sample.remaining_amount > 0.0001
+)
+
+# Name search (see name_search_filter): the trigram index serves substring
+# ILIKE, the lower(name) B-tree serves prefix search as a range scan
+Index(
+    'idx_samples_name_trgm',
+    Sample.name,
+    postgresql_using='gin',
+    postgresql_ops={'name': 'gin_trgm_ops'}
+)
+
+Index(
+    'idx_samples_name_lower_prefix',
+    func.lower(Sample.name).label('name_lower'),
+    postgresql_ops={'name_lower': 'text_pattern_ops'}
+)
@@ -14,7 +14,7 @@ Phase 2 Addition:
 - samples relationship: Track all samples that use this support material
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import FetchedValue, Column, Index, Integer, String, Text, DateTime
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -41,6 +41,27 @@ class Support(Base):
 
     __tablename__ = "supports"
 
+    __table_args__ = (
+        # Trigram indexes (pg_trgm) let search with ILIKE '%term%' on
+        # either text column use an index instead of scanning the table
+        Index(
+            'idx_supports_descriptive_name_trgm',
+            'descriptive_name',
+            postgresql_using='gin',
+            postgresql_ops={'descriptive_name': 'gin_trgm_ops'}
+        ),
+        Index(
+            'idx_supports_description_trgm',
+            'description',
+            postgresql_using='gin',
+            postgresql_ops={'description': 'gin_trgm_ops'}
+        ),
+    )
+
+    # Fetch server-generated values (id, timestamps) with RETURNING during
+    # the flush instead of with a separate SELECT afterwards
+    __mapper_args__ = {'eager_defaults': True}
+
     # Primary key
     id = Column(Integer, primary_key=True, autoincrement=True)
 
@@ -65,9 +86,11 @@ class Support(Base):
         nullable=False
     )
 
+    # Set by the update_updated_at_column trigger on every UPDATE
     updated_at = Column(
         DateTime(timezone=True),
         server_default=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False
     )
 
@@ -24,9 +24,10 @@ from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 
 from app.database import get_db
-from app.models.analysis.characterization import Characterization
-from app.models.catalysts.catalyst import Catalyst
-from app.models.catalysts.sample import Sample
+from app.routers.utils import add_association, remove_association
+from app.models.analysis.characterization import Characterization, user_characterization
+from app.models.catalysts.catalyst import Catalyst, catalyst_characterization
+from app.models.catalysts.sample import Sample, sample_characterization
 from app.models.core.user import User
 # File model will be imported in Phase 3
 # from app.models.core.file import File
@@ -255,9 +256,7 @@ def update_characterization(
     Update a characterization with partial data.
     """
 
-    db_char = db.query(Characterization).filter(
-        Characterization.id == characterization_id
-    ).first()
+    db_char = db.get(Characterization, characterization_id)
 
     if db_char is None:
         raise HTTPException(
@@ -314,9 +313,7 @@ def delete_characterization(
     cascade delete on the junction tables.
     """
 
-    db_char = db.query(Characterization).filter(
-        Characterization.id == characterization_id
-    ).first()
+    db_char = db.get(Characterization, characterization_id)
 
     if db_char is None:
         raise HTTPException(
@@ -345,24 +342,25 @@ def add_catalyst_to_characterization(
     Link a catalyst to this characterization.
     """
 
-    char = db.query(Characterization).filter(
-        Characterization.id == characterization_id
-    ).first()
+    char = db.get(Characterization, characterization_id)
     if not char:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Characterization {characterization_id} not found"
         )
 
-    catalyst = db.query(Catalyst).filter(Catalyst.id == catalyst_id).first()
+    catalyst = db.get(Catalyst, catalyst_id)
     if not catalyst:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Catalyst {catalyst_id} not found"
         )
 
-    if catalyst not in char.catalysts:
-        char.catalysts.append(catalyst)
+    if add_association(
+            db, catalyst_characterization,
+            catalyst_id=catalyst_id,
+            characterization_id=characterization_id
+    ):
         db.commit()
 
     return None
@@ -379,24 +377,25 @@ def remove_catalyst_from_characterization(
     Remove a catalyst link from this characterization.
     """
 
-    char = db.query(Characterization).filter(
-        Characterization.id == characterization_id
-    ).first()
+    char = db.get(Characterization, characterization_id)
     if not char:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Characterization {characterization_id} not found"
         )
 
-    catalyst = db.query(Catalyst).filter(Catalyst.id == catalyst_id).first()
+    catalyst = db.get(Catalyst, catalyst_id)
     if not catalyst:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Catalyst {catalyst_id} not found"
         )
 
-    if catalyst in char.catalysts:
-        char.catalysts.remove(catalyst)
+    if remove_association(
+            db, catalyst_characterization,
+            catalyst_id=catalyst_id,
+            characterization_id=characterization_id
+    ):
         db.commit()
 
     return None
@@ -413,24 +412,25 @@ def add_sample_to_characterization(
     Link a sample to this characterization.
     """
 
-    char = db.query(Characterization).filter(
-        Characterization.id == characterization_id
-    ).first()
+    char = db.get(Characterization, characterization_id)
     if not char:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Characterization {characterization_id} not found"
         )
 
-    sample = db.query(Sample).filter(Sample.id == sample_id).first()
+    sample = db.get(Sample, sample_id)
     if not sample:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Sample {sample_id} not found"
         )
 
-    if sample not in char.samples:
-        char.samples.append(sample)
+    if add_association(
+            db, sample_characterization,
+            sample_id=sample_id,
+            characterization_id=characterization_id
+    ):
         db.commit()
 
     return None
@@ -447,24 +447,25 @@ def remove_sample_from_characterization(
     Remove a sample link from this characterization.
     """
 
-    char = db.query(Characterization).filter(
-        Characterization.id == characterization_id
-    ).first()
+    char = db.get(Characterization, characterization_id)
     if not char:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Characterization {characterization_id} not found"
         )
 
-    sample = db.query(Sample).filter(Sample.id == sample_id).first()
+    sample = db.get(Sample, sample_id)
     if not sample:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Sample {sample_id} not found"
         )
 
-    if sample in char.samples:
-        char.samples.remove(sample)
+    if remove_association(
+            db, sample_characterization,
+            sample_id=sample_id,
+            characterization_id=characterization_id
+    ):
         db.commit()
 
     return None
@@ -481,24 +482,25 @@ def add_user_to_characterization(
     Record that a user performed this characterization.
     """
 
-    char = db.query(Characterization).filter(
-        Characterization.id == characterization_id
-    ).first()
+    char = db.get(Characterization, characterization_id)
     if not char:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Characterization {characterization_id} not found"
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User {user_id} not found"
         )
 
-    if user not in char.users:
-        char.users.append(user)
+    if add_association(
+            db, user_characterization,
+            user_id=user_id,
+            characterization_id=characterization_id
+    ):
         db.commit()
 
     return None
@@ -515,24 +517,25 @@ def remove_user_from_characterization(
     Remove a user's association with this characterization.
     """
 
-    char = db.query(Characterization).filter(
-        Characterization.id == characterization_id
-    ).first()
+    char = db.get(Characterization, characterization_id)
     if not char:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Characterization {characterization_id} not found"
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User {user_id} not found"
         )
 
-    if user in char.users:
-        char.users.remove(user)
+    if remove_association(
+            db, user_characterization,
+            user_id=user_id,
+            characterization_id=characterization_id
+    ):
         db.commit()
 
     return None
\ No newline at end of file
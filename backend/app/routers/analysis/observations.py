@@ -26,9 +26,10 @@ from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 
 from app.database import get_db
-from app.models.analysis.observation import Observation
-from app.models.catalysts.catalyst import Catalyst
-from app.models.catalysts.sample import Sample
+from app.routers.utils import add_association, remove_association
+from app.models.analysis.observation import Observation, user_observation
+from app.models.catalysts.catalyst import Catalyst, catalyst_observation
+from app.models.catalysts.sample import Sample, sample_observation
 from app.models.core.user import User
 # File model will be imported in Phase 3
 # from app.models.core.file import File
@@ -263,9 +264,7 @@ def update_observation(
     value, modify it, and send the complete updated object.
     """
 
-    db_obs = db.query(Observation).filter(
-        Observation.id == observation_id
-    ).first()
+    db_obs = db.get(Observation, observation_id)
 
     if db_obs is None:
         raise HTTPException(
@@ -327,9 +326,7 @@ def delete_observation(
     through cascade delete on the junction tables.
     """
 
-    db_obs = db.query(Observation).filter(
-        Observation.id == observation_id
-    ).first()
+    db_obs = db.get(Observation, observation_id)
 
     if db_obs is None:
         raise HTTPException(
@@ -358,22 +355,25 @@ def add_catalyst_to_observation(
     Link a catalyst to this observation.
     """
 
-    obs = db.query(Observation).filter(Observation.id == observation_id).first()
+    obs = db.get(Observation, observation_id)
     if not obs:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Observation {observation_id} not found"
         )
 
-    catalyst = db.query(Catalyst).filter(Catalyst.id == catalyst_id).first()
+    catalyst = db.get(Catalyst, catalyst_id)
     if not catalyst:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Catalyst {catalyst_id} not found"
         )
 
-    if catalyst not in obs.catalysts:
-        obs.catalysts.append(catalyst)
+    if add_association(
+            db, catalyst_observation,
+            catalyst_id=catalyst_id,
+            observation_id=observation_id
+    ):
         db.commit()
 
     return None
@@ -390,22 +390,25 @@ def remove_catalyst_from_observation(
     Remove a catalyst link from this observation.
     """
 
-    obs = db.query(Observation).filter(Observation.id == observation_id).first()
+    obs = db.get(Observation, observation_id)
     if not obs:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Observation {observation_id} not found"
         )
 
-    catalyst = db.query(Catalyst).filter(Catalyst.id == catalyst_id).first()
+    catalyst = db.get(Catalyst, catalyst_id)
     if not catalyst:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Catalyst {catalyst_id} not found"
         )
 
-    if catalyst in obs.catalysts:
-        obs.catalysts.remove(catalyst)
+    if remove_association(
+            db, catalyst_observation,
+            catalyst_id=catalyst_id,
+            observation_id=observation_id
+    ):
         db.commit()
 
     return None
@@ -422,22 +425,25 @@ def add_sample_to_observation(
     Link a sample to this observation.
     """
 
-    obs = db.query(Observation).filter(Observation.id == observation_id).first()
+    obs = db.get(Observation, observation_id)
     if not obs:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Observation {observation_id} not found"
         )
 
-    sample = db.query(Sample).filter(Sample.id == sample_id).first()
+    sample = db.get(Sample, sample_id)
     if not sample:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Sample {sample_id} not found"
         )
 
-    if sample not in obs.samples:
-        obs.samples.append(sample)
+    if add_association(
+            db, sample_observation,
+            sample_id=sample_id,
+            observation_id=observation_id
+    ):
         db.commit()
 
     return None
@@ -454,22 +460,25 @@ def remove_sample_from_observation(
     Remove a sample link from this observation.
     """
 
-    obs = db.query(Observation).filter(Observation.id == observation_id).first()
+    obs = db.get(Observation, observation_id)
     if not obs:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Observation {observation_id} not found"
         )
 
-    sample = db.query(Sample).filter(Sample.id == sample_id).first()
+    sample = db.get(Sample, sample_id)
     if not sample:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Sample {sample_id} not found"
         )
 
-    if sample in obs.samples:
-        obs.samples.remove(sample)
+    if remove_association(
+            db, sample_observation,
+            sample_id=sample_id,
+            observation_id=observation_id
+    ):
         db.commit()
 
     return None
@@ -486,22 +495,25 @@ def add_user_to_observation(
     Record that a user made this observation.
     """
 
-    obs = db.query(Observation).filter(Observation.id == observation_id).first()
+    obs = db.get(Observation, observation_id)
     if not obs:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Observation {observation_id} not found"
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User {user_id} not found"
         )
 
-    if user not in obs.users:
-        obs.users.append(user)
+    if add_association(
+            db, user_observation,
+            user_id=user_id,
+            observation_id=observation_id
+    ):
         db.commit()
 
     return None
@@ -518,22 +530,25 @@ def remove_user_from_observation(
     Remove a user's association with this observation.
     """
 
-    obs = db.query(Observation).filter(Observation.id == observation_id).first()
+    obs = db.get(Observation, observation_id)
     if not obs:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Observation {observation_id} not found"
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User {user_id} not found"
         )
 
-    if user in obs.users:
-        obs.users.remove(user)
+    if remove_association(
+            db, user_observation,
+            user_id=user_id,
+            observation_id=observation_id
+    ):
         db.commit()
 
     return None
@@ -557,7 +572,7 @@ def add_file_to_observation(
     TODO: Implement when File model is available in Phase 3.
     """
 
-    obs = db.query(Observation).filter(Observation.id == observation_id).first()
+    obs = db.get(Observation, observation_id)
     if not obs:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -584,7 +599,7 @@ def remove_file_from_observation(
     TODO: Implement when File model is available in Phase 3.
     """
 
-    obs = db.query(Observation).filter(Observation.id == observation_id).first()
+    obs = db.get(Observation, observation_id)
     if not obs:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -12,6 +12,7 @@ Endpoint Summary:
 - PATCH  /api/catalysts/{id}          Update
 - DELETE /api/catalysts/{id}          Delete
 - PATCH  /api/catalysts/{id}/consume  Consume material
+- GET    /api/catalysts/{id}/consumption  Consumption log
 - POST   /api/catalysts/{id}/input-catalysts/{input_id}    Add derivation link
 - DELETE /api/catalysts/{id}/input-catalysts/{input_id}    Remove derivation link
 - POST   /api/catalysts/{id}/characterizations/{char_id}   Link characterization
@@ -23,18 +24,32 @@ Endpoint Summary:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session, joinedload
+from pydantic import TypeAdapter
+from sqlalchemy import select, update, delete, func, bindparam, lambda_stmt, tuple_
+from sqlalchemy.orm import Session, joinedload, selectinload, raiseload, defer, undefer_group
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.exc import IntegrityError
 from typing import List, Optional
+from functools import lru_cache
 from decimal import Decimal
 
 from app.database import get_db
-from app.models.catalysts.catalyst import Catalyst
+from app.routers.utils import (
+    dump_json_items, json_array_response, name_search_filter,
+    add_association, remove_association, include_dependency,
+    append_consumption_note, NEXT_CURSOR_HEADER, encode_cursor, decode_created_at_cursor
+)
+from app.models.catalysts.catalyst import (
+    Catalyst, CatalystConsumption, catalyst_catalyst,
+    catalyst_characterization, catalyst_observation, user_catalyst
+)
 from app.models.catalysts.method import Method
 from app.models.analysis.characterization import Characterization
 from app.models.analysis.observation import Observation
 from app.models.core.user import User
 from app.schemas.catalysts.catalyst import (
-    CatalystCreate, CatalystUpdate, CatalystResponse
+    CatalystCreate, CatalystUpdate, CatalystListItem, CatalystResponse,
+    CatalystConsumptionResponse
 )
 
 router = APIRouter(
@@ -43,92 +58,283 @@ router = APIRouter(
 )
 
 
-@router.get("/", response_model=List[CatalystResponse])
+# Prebuilt adapter for the list endpoint's JSON fast path
+_CATALYST_LIST_ADAPTER = TypeAdapter(List[CatalystListItem])
+
+# Rows fetched and serialized per batch by list_catalysts
+_LIST_PARTITION_SIZE = 100
+
+# Loads the deferred count columns serialized by the catalyst schemas
+_WITH_COUNTS = undefer_group('counts')
+
+# Columns selected by list_catalysts when no relationships are included
+_LIST_COLUMNS = (
+    Catalyst.id,
+    Catalyst.name,
+    Catalyst.method_id,
+    Catalyst.yield_amount,
+    Catalyst.remaining_amount,
+    Catalyst.storage_location,
+    Catalyst.created_at,
+    Catalyst.updated_at,
+    Catalyst.sample_count,
+    Catalyst.characterization_count,
+)
+
+
+def _list_item_from_row(row) -> dict:
+    """
+    Build list item data from a _LIST_COLUMNS row.
+
+    The model's is_depleted and usage_percentage properties only read
+    yield_amount and remaining_amount, which the row carries as
+    attributes, so they are evaluated against the row directly to keep a
+    single definition of each.
+    """
+    item = dict(row._mapping)
+    item['is_depleted'] = Catalyst.is_depleted.fget(row)
+    item['usage_percentage'] = Catalyst.usage_percentage.fget(row)
+    return item
+
+
+# =============================================================================
+# Include Handling
+# =============================================================================
+
+# Loader option for each relationship that can be requested via ?include=.
+# Built once at import time; loader options are immutable and reusable.
+# The many-to-one method is joined; collections use selectinload (one
+# extra "WHERE id IN (...)" query each) so rows never multiply.
+INCLUDE_OPTIONS = {
+    'method': joinedload(Catalyst.method),
+    'input_catalysts': selectinload(Catalyst.input_catalysts),
+    'output_catalysts': selectinload(Catalyst.output_catalysts),
+    'samples': selectinload(Catalyst.samples),
+    'characterizations': selectinload(Catalyst.characterizations),
+    'observations': selectinload(Catalyst.observations),
+    'users': selectinload(Catalyst.users),
+}
+
+
+# Dependency yielding the validated set of requested relationships
+get_catalyst_includes = include_dependency(INCLUDE_OPTIONS)
+
+
+@lru_cache(maxsize=256)
+def _include_options(include: frozenset) -> tuple:
+    """Loader options for a validated set of include names, cached per set."""
+    return tuple(
+        option for name, option in INCLUDE_OPTIONS.items()
+        if name in include
+    )
+
+
+# =============================================================================
+# Validation Helpers
+# =============================================================================
+
+# Fixed-shape lookups built once as lambda statements: SQLAlchemy caches
+# them on the lambda's code location, so per request only the parameters
+# are bound instead of rebuilding and re-keying the statement.
+_REMAINING_AMOUNT_BY_ID = lambda_stmt(
+    lambda: select(Catalyst.remaining_amount)
+    .where(Catalyst.id == bindparam('catalyst_id'))
+)
+
+# Name of the CHECK constraint enforcing remaining_amount <= yield
+_REMAINING_WITHIN_YIELD = 'check_catalyst_remaining_within_yield'
+
+# Association fields accepted by create/update, mapped to:
+# (target ID column, junction table, junction column for this catalyst,
+#  junction column for the target, relationship name, error label)
+_ASSOCIATIONS = {
+    'input_catalyst_ids': (
+        Catalyst.id, catalyst_catalyst, 'output_catalyst_id',
+        'input_catalyst_id', 'input_catalysts', "Input catalyst"
+    ),
+    'characterization_ids': (
+        Characterization.id, catalyst_characterization, 'catalyst_id',
+        'characterization_id', 'characterizations', "Characterization"
+    ),
+    'observation_ids': (
+        Observation.id, catalyst_observation, 'catalyst_id',
+        'observation_id', 'observations', "Observation"
+    ),
+    'user_ids': (
+        User.id, user_catalyst, 'catalyst_id',
+        'user_id', 'users', "User"
+    ),
+}
+
+
+def _count_matching(id_column, ids: set):
+    """Scalar subquery counting the rows whose ID is in ``ids``."""
+    return select(func.count(id_column)).where(id_column.in_(ids)).scalar_subquery()
+
+
+def _validate_references(db: Session, method_id: Optional[int], id_sets: dict) -> None:
+    """
+    Check the method and all association IDs in a single round trip.
+
+    The happy path is one SELECT of COUNT subqueries. Only when a count
+    falls short are the individual missing IDs looked up, and every
+    problem is reported in one 400 response.
+    """
+    checks = []
+    if method_id:
+        checks.append(('method_id', Method.id, {method_id}))
+    for field, ids in id_sets.items():
+        if ids:
+            checks.append((field, _ASSOCIATIONS[field][0], ids))
+
+    if not checks:
+        return
+
+    counts = db.execute(select(*(
+        _count_matching(id_column, ids) for _, id_column, ids in checks
+    ))).one()
+
+    errors = []
+    for (field, id_column, ids), count in zip(checks, counts):
+        if count == len(ids):
+            continue
+        missing_ids = ids - set(db.scalars(select(id_column).where(id_column.in_(ids))))
+        if field == 'method_id':
+            errors.append(f"Method with ID {method_id} not found")
+        else:
+            errors.append(f"{_ASSOCIATIONS[field][5]} IDs not found: {sorted(missing_ids)}")
+
+    if errors:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="; ".join(errors)
+        )
+
+
+def _write_links(db: Session, catalyst_id: int, field: str, ids: set,
+                 replace: bool = False) -> None:
+    """
+    Write a catalyst's association rows directly to the junction table.
+
+    With replace=True the existing links are deleted first. The insert is
+    a single executemany, which the driver sends as one multi-row INSERT.
+    """
+    _, junction, own_key, target_key, _, _ = _ASSOCIATIONS[field]
+
+    if replace:
+        db.execute(delete(junction).where(junction.c[own_key] == catalyst_id))
+
+    if ids:
+        db.execute(
+            junction.insert(),
+            [{own_key: catalyst_id, target_key: target_id} for target_id in sorted(ids)]
+        )
+
+
+@router.get("/", response_model=List[CatalystListItem])
 def list_catalysts(
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=1000),
-        search: Optional[str] = Query(None, description="Search in catalyst names"),
-        method_id: Optional[int] = Query(None, description="Filter by synthesis method"),
-        depleted: Optional[bool] = Query(None, description="Filter by depletion status"),
-        include: Optional[str] = Query(
+        cursor: Optional[str] = Query(
             None,
-            description="Relationships: method,input_catalysts,output_catalysts,"
-                        "samples,characterizations,observations,users"
+            description="Resume after the last catalyst of the previous page "
+                        "(value of the X-Next-Cursor response header)"
         ),
+        search: Optional[str] = Query(None, description="Search in catalyst names (append * for a prefix match)"),
+        method_id: Optional[int] = Query(None, description="Filter by synthesis method"),
+        depleted: Optional[bool] = Query(None, description="Filter by depletion status"),
+        include: frozenset = Depends(get_catalyst_includes),
         db: Session = Depends(get_db)
 ):
     """
     List catalysts with filtering and relationship inclusion.
+
+    Results are ordered newest first. When a page is full, the
+    X-Next-Cursor header holds a cursor for the next page; passing it
+    back as ``cursor`` continues from the last row via the
+    (created_at, id) index instead of counting past ``skip`` rows.
+
+    Without includes, only the list columns are selected and rows are
+    serialized straight from the result tuples, skipping ORM object
+    construction entirely.
     """
 
-    query = db.query(Catalyst)
+    stmt = select(Catalyst) if include else select(*_LIST_COLUMNS)
+
+    if cursor:
+        created_at, last_id = decode_created_at_cursor(cursor)
+        stmt = stmt.where(tuple_(Catalyst.created_at, Catalyst.id) < (created_at, last_id))
 
-    if search:
-        query = query.filter(Catalyst.name.ilike(f"%{search}%"))
+    search_clause = name_search_filter(Catalyst.name, search)
+    if search_clause is not None:
+        stmt = stmt.where(search_clause)
 
     if method_id is not None:
-        query = query.filter(Catalyst.method_id == method_id)
+        stmt = stmt.where(Catalyst.method_id == method_id)
 
     if depleted is not None:
         if depleted:
-            query = query.filter(Catalyst.remaining_amount <= 0.0001)
+            stmt = stmt.where(Catalyst.remaining_amount <= 0.0001)
         else:
-            query = query.filter(Catalyst.remaining_amount > 0.0001)
+            stmt = stmt.where(Catalyst.remaining_amount > 0.0001)
 
     if include:
-        include_rels = {rel.strip() for rel in include.split(',')}
+        # Anything not explicitly included must never be lazy loaded per
+        # row. Notes are not part of the list projection, so leave them
+        # unloaded.
+        stmt = stmt.options(
+            *_include_options(include),
+            _WITH_COUNTS,
+            raiseload('*'),
+            defer(Catalyst.notes, raiseload=True)
+        )
+
+    stmt = (
+        stmt.order_by(Catalyst.created_at.desc(), Catalyst.id.desc())
+        .offset(skip)
+        .limit(limit)
+    )
 
-        if 'method' in include_rels:
-            query = query.options(joinedload(Catalyst.method))
-        if 'input_catalysts' in include_rels:
-            query = query.options(joinedload(Catalyst.input_catalysts))
-        if 'output_catalysts' in include_rels:
-            query = query.options(joinedload(Catalyst.output_catalysts))
-        if 'samples' in include_rels:
-            query = query.options(joinedload(Catalyst.samples))
-        if 'characterizations' in include_rels:
-            query = query.options(joinedload(Catalyst.characterizations))
-        if 'observations' in include_rels:
-            query = query.options(joinedload(Catalyst.observations))
-        if 'users' in include_rels:
-            query = query.options(joinedload(Catalyst.users))
+    # Fetch and serialize one partition at a time, so at most
+    # _LIST_PARTITION_SIZE ORM objects (and their included relationships)
+    # are alive at once instead of the whole page
+    stmt = stmt.execution_options(yield_per=_LIST_PARTITION_SIZE)
+    result = db.scalars(stmt) if include else db.execute(stmt)
 
-    query = query.order_by(Catalyst.created_at.desc())
+    chunks = []
+    row_count = 0
+    last = None
+    for partition in result.partitions():
+        items = partition if include else [_list_item_from_row(row) for row in partition]
+        chunks.append(dump_json_items(_CATALYST_LIST_ADAPTER, items))
+        row_count += len(partition)
+        last = partition[-1]
 
-    return query.offset(skip).limit(limit).all()
+    headers = None
+    if row_count == limit:
+        headers = {NEXT_CURSOR_HEADER: encode_cursor(last.created_at, last.id)}
+
+    # The page is fully encoded; hand the pooled connection back now
+    # rather than after the response has been sent
+    db.close()
+
+    return json_array_response(chunks, headers=headers)
 
 
 @router.get("/{catalyst_id}", response_model=CatalystResponse)
 def get_catalyst(
         catalyst_id: int,
-        include: Optional[str] = Query(None),
+        include: frozenset = Depends(get_catalyst_includes),
         db: Session = Depends(get_db)
 ):
     """
     Retrieve a single catalyst by ID.
     """
 
-    query = db.query(Catalyst)
+    options = list(_include_options(include))
+    options.extend((_WITH_COUNTS, raiseload('*')))
 
-    if include:
-        include_rels = {rel.strip() for rel in include.split(',')}
-
-        if 'method' in include_rels:
-            query = query.options(joinedload(Catalyst.method))
-        if 'input_catalysts' in include_rels:
-            query = query.options(joinedload(Catalyst.input_catalysts))
-        if 'output_catalysts' in include_rels:
-            query = query.options(joinedload(Catalyst.output_catalysts))
-        if 'samples' in include_rels:
-            query = query.options(joinedload(Catalyst.samples))
-        if 'characterizations' in include_rels:
-            query = query.options(joinedload(Catalyst.characterizations))
-        if 'observations' in include_rels:
-            query = query.options(joinedload(Catalyst.observations))
-        if 'users' in include_rels:
-            query = query.options(joinedload(Catalyst.users))
-
-    catalyst = query.filter(Catalyst.id == catalyst_id).first()
+    catalyst = db.get(Catalyst, catalyst_id, options=options)
 
     if catalyst is None:
         raise HTTPException(
@@ -136,6 +342,8 @@ def get_catalyst(
             detail=f"Catalyst with ID {catalyst_id} not found"
         )
 
+    db.close()
+
     return catalyst
 
 
@@ -148,60 +356,32 @@ def create_catalyst(
     Create a new catalyst.
     """
 
-    # Validate method reference
-    if catalyst.method_id:
-        method = db.query(Method).filter(Method.id == catalyst.method_id).first()
-        if not method:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Method with ID {catalyst.method_id} not found"
-            )
+    # Validate every referenced ID in one round trip
+    id_sets = {
+        field: set(getattr(catalyst, field))
+        for field in _ASSOCIATIONS
+        if getattr(catalyst, field)
+    }
+    _validate_references(db, catalyst.method_id, id_sets)
 
     # Create catalyst
-    cat_data = catalyst.model_dump(exclude={
-        'input_catalyst_ids', 'characterization_ids',
-        'observation_ids', 'user_ids'
-    })
+    cat_data = catalyst.model_dump(exclude=set(_ASSOCIATIONS))
     db_catalyst = Catalyst(**cat_data)
 
-    # Establish input catalyst relationships
-    if catalyst.input_catalyst_ids:
-        input_cats = db.query(Catalyst).filter(
-            Catalyst.id.in_(catalyst.input_catalyst_ids)
-        ).all()
-        found_ids = {c.id for c in input_cats}
-        missing_ids = set(catalyst.input_catalyst_ids) - found_ids
-        if missing_ids:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Input catalyst IDs not found: {sorted(missing_ids)}"
-            )
-        db_catalyst.input_catalysts = input_cats
-
-    # Establish characterization relationships
-    if catalyst.characterization_ids:
-        chars = db.query(Characterization).filter(
-            Characterization.id.in_(catalyst.characterization_ids)
-        ).all()
-        db_catalyst.characterizations = chars
-
-    # Establish observation relationships
-    if catalyst.observation_ids:
-        obs = db.query(Observation).filter(
-            Observation.id.in_(catalyst.observation_ids)
-        ).all()
-        db_catalyst.observations = obs
-
-    # Establish user relationships
-    if catalyst.user_ids:
-        users = db.query(User).filter(User.id.in_(catalyst.user_ids)).all()
-        db_catalyst.users = users
-
     db.add(db_catalyst)
+    db.flush()
+    catalyst_id = db_catalyst.id
+
+    # Link associations straight through the junction tables; only the
+    # validated IDs are needed, so no related objects are hydrated
+    for field, ids in id_sets.items():
+        _write_links(db, catalyst_id, field, ids)
+
     db.commit()
-    db.refresh(db_catalyst)
 
-    return db_catalyst
+    # refresh() would leave the counts deferred; reload them in the same
+    # SELECT instead
+    return db.get(Catalyst, catalyst_id, options=[_WITH_COUNTS], populate_existing=True)
 
 
 @router.patch("/{catalyst_id}", response_model=CatalystResponse)
@@ -214,7 +394,7 @@ def update_catalyst(
     Update a catalyst with partial data.
     """
 
-    db_catalyst = db.query(Catalyst).filter(Catalyst.id == catalyst_id).first()
+    db_catalyst = db.get(Catalyst, catalyst_id)
 
     if db_catalyst is None:
         raise HTTPException(
@@ -224,55 +404,43 @@ def update_catalyst(
 
     update_data = catalyst_update.model_dump(exclude_unset=True)
 
-    # Validate method if updating
-    if 'method_id' in update_data and update_data['method_id']:
-        method = db.query(Method).filter(Method.id == update_data['method_id']).first()
-        if not method:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Method with ID {update_data['method_id']} not found"
-            )
-
-    # Handle relationship updates
-    if 'input_catalyst_ids' in update_data:
-        ids = update_data.pop('input_catalyst_ids')
-        if ids is not None:
-            cats = db.query(Catalyst).filter(Catalyst.id.in_(ids)).all()
-            db_catalyst.input_catalysts = cats
-
-    if 'characterization_ids' in update_data:
-        ids = update_data.pop('characterization_ids')
-        if ids is not None:
-            chars = db.query(Characterization).filter(Characterization.id.in_(ids)).all()
-            db_catalyst.characterizations = chars
-
-    if 'observation_ids' in update_data:
-        ids = update_data.pop('observation_ids')
-        if ids is not None:
-            obs = db.query(Observation).filter(Observation.id.in_(ids)).all()
-            db_catalyst.observations = obs
-
-    if 'user_ids' in update_data:
-        ids = update_data.pop('user_ids')
-        if ids is not None:
-            users = db.query(User).filter(User.id.in_(ids)).all()
-            db_catalyst.users = users
+    # Validate the method and replacement association IDs in one round trip
+    id_sets = {
+        field: set(update_data[field])
+        for field in _ASSOCIATIONS
+        if update_data.get(field) is not None
+    }
+    _validate_references(db, update_data.get('method_id'), id_sets)
+
+    # Replace associations with bulk DML on the junction tables instead of
+    # hydrating related objects; expire the relationships so later access
+    # re-reads them
+    for field in _ASSOCIATIONS:
+        update_data.pop(field, None)
+    for field, ids in id_sets.items():
+        _write_links(db, catalyst_id, field, ids, replace=True)
+    if id_sets:
+        db.expire(db_catalyst, [_ASSOCIATIONS[field][4] for field in id_sets])
 
     # Update scalar fields
     for field, value in update_data.items():
         setattr(db_catalyst, field, value)
 
-    # Validate remaining vs yield
-    if db_catalyst.remaining_amount > db_catalyst.yield_amount:
+    # remaining_amount <= yield is enforced by a CHECK constraint
+    try:
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if _REMAINING_WITHIN_YIELD not in str(e.orig):
+            raise
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="remaining_amount cannot exceed yield_amount"
         )
 
-    db.commit()
-    db.refresh(db_catalyst)
-
-    return db_catalyst
+    # refresh() would leave the counts deferred; reload them in the same
+    # SELECT instead
+    return db.get(Catalyst, catalyst_id, options=[_WITH_COUNTS], populate_existing=True)
 
 
 @router.delete("/{catalyst_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -287,7 +455,7 @@ def delete_catalyst(
     due to cascade delete.
     """
 
-    db_catalyst = db.query(Catalyst).filter(Catalyst.id == catalyst_id).first()
+    db_catalyst = db.get(Catalyst, catalyst_id)
 
     if db_catalyst is None:
         raise HTTPException(
@@ -304,42 +472,108 @@ def delete_catalyst(
 @router.patch("/{catalyst_id}/consume", response_model=CatalystResponse)
 def consume_catalyst_material(
         catalyst_id: int,
-        amount: Decimal = Query(..., gt=0),
+        amount: Decimal = Query(
+            ...,
+            gt=0,
+            max_digits=8,
+            decimal_places=4,
+            description="Amount to consume (grams), at the inventory column's precision"
+        ),
         notes: Optional[str] = Query(None),
         db: Session = Depends(get_db)
 ):
     """
     Consume material from a catalyst's inventory.
+
+    The stock check and the decrement happen in a single conditional
+    UPDATE, so concurrent consumers can never drive remaining_amount
+    below zero. The comparison and subtraction are done by PostgreSQL on
+    numeric(8,4) values; amount is limited to the same scale so the
+    arithmetic stays exact instead of being rounded on write.
     """
 
-    db_catalyst = db.query(Catalyst).filter(Catalyst.id == catalyst_id).first()
+    remaining_after = Catalyst.remaining_amount - amount
+    values = {'remaining_amount': remaining_after}
 
-    if db_catalyst is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Catalyst with ID {catalyst_id} not found"
-        )
-
-    current_amount = Decimal(str(db_catalyst.remaining_amount))
+    if notes:
+        # Appended in SQL; the date comes from the database clock, like
+        # consumed_at
+        values['notes'] = append_consumption_note(Catalyst.notes, amount, notes)
+
+    # The aggregate column_properties are not part of RETURNING Catalyst;
+    # return them alongside so the response needs no follow-up SELECT
+    stmt = (
+        update(Catalyst)
+        .where(Catalyst.id == catalyst_id, Catalyst.remaining_amount >= amount)
+        .values(**values)
+        .returning(Catalyst, Catalyst.sample_count, Catalyst.characterization_count)
+        .execution_options(synchronize_session=False)
+    )
+    row = db.execute(stmt).one_or_none()
+
+    if row is None:
+        # Nothing was updated - tell a missing catalyst apart from low stock
+        current_amount = db.execute(
+            _REMAINING_AMOUNT_BY_ID, {'catalyst_id': catalyst_id}
+        ).scalar_one_or_none()
+
+        if current_amount is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Catalyst with ID {catalyst_id} not found"
+            )
 
-    if amount > current_amount:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Cannot consume {amount}g - only {current_amount}g remaining"
         )
 
-    db_catalyst.remaining_amount = current_amount - amount
+    db_catalyst, sample_count, characterization_count = row
+    set_committed_value(db_catalyst, 'sample_count', sample_count)
+    set_committed_value(db_catalyst, 'characterization_count', characterization_count)
 
-    if notes:
-        existing_notes = db_catalyst.notes or ""
-        timestamp = db_catalyst.updated_at.strftime("%Y-%m-%d")
-        consumption_note = f"\n[{timestamp}] Consumed {amount}g: {notes}"
-        db_catalyst.notes = existing_notes + consumption_note
+    # Record the withdrawal in the consumption log (same transaction)
+    db.add(CatalystConsumption(
+        catalyst_id=catalyst_id,
+        amount=amount,
+        notes=notes
+    ))
 
+    # Serialize from the RETURNING row before commit expires it
+    response = CatalystResponse.model_validate(db_catalyst)
     db.commit()
-    db.refresh(db_catalyst)
 
-    return db_catalyst
+    return response
+
+
+@router.get("/{catalyst_id}/consumption", response_model=List[CatalystConsumptionResponse])
+def get_consumption_log(
+        catalyst_id: int,
+        skip: int = Query(0, ge=0),
+        limit: int = Query(50, ge=1, le=500),
+        db: Session = Depends(get_db)
+):
+    """
+    Get the material consumption log for a catalyst.
+
+    Returns one entry per consume call, most recent first.
+    """
+
+    if db.get(Catalyst, catalyst_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Catalyst with ID {catalyst_id} not found"
+        )
+
+    stmt = (
+        select(CatalystConsumption)
+        .where(CatalystConsumption.catalyst_id == catalyst_id)
+        .order_by(CatalystConsumption.consumed_at.desc(), CatalystConsumption.id.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+
+    return db.scalars(stmt).all()
 
 
 # =============================================================================
@@ -357,16 +591,17 @@ def add_input_catalyst(
     Link an input catalyst (derivation relationship).
     """
 
-    catalyst = db.query(Catalyst).filter(Catalyst.id == catalyst_id).first()
-    if not catalyst:
+    if db.get(Catalyst, catalyst_id) is None:
         raise HTTPException(status_code=404, detail=f"Catalyst {catalyst_id} not found")
 
-    input_cat = db.query(Catalyst).filter(Catalyst.id == input_catalyst_id).first()
-    if not input_cat:
+    if db.get(Catalyst, input_catalyst_id) is None:
         raise HTTPException(status_code=404, detail=f"Catalyst {input_catalyst_id} not found")
 
-    if input_cat not in catalyst.input_catalysts:
-        catalyst.input_catalysts.append(input_cat)
+    if add_association(
+            db, catalyst_catalyst,
+            input_catalyst_id=input_catalyst_id,
+            output_catalyst_id=catalyst_id
+    ):
         db.commit()
 
     return None
@@ -383,16 +618,17 @@ def remove_input_catalyst(
     Remove an input catalyst link.
     """
 
-    catalyst = db.query(Catalyst).filter(Catalyst.id == catalyst_id).first()
-    if not catalyst:
+    if db.get(Catalyst, catalyst_id) is None:
         raise HTTPException(status_code=404, detail=f"Catalyst {catalyst_id} not found")
 
-    input_cat = db.query(Catalyst).filter(Catalyst.id == input_catalyst_id).first()
-    if not input_cat:
+    if db.get(Catalyst, input_catalyst_id) is None:
         raise HTTPException(status_code=404, detail=f"Catalyst {input_catalyst_id} not found")
 
-    if input_cat in catalyst.input_catalysts:
-        catalyst.input_catalysts.remove(input_cat)
+    if remove_association(
+            db, catalyst_catalyst,
+            input_catalyst_id=input_catalyst_id,
+            output_catalyst_id=catalyst_id
+    ):
         db.commit()
 
     return None
@@ -407,16 +643,17 @@ def add_characterization_to_catalyst(
 ):
     """Link a characterization to this catalyst."""
 
-    catalyst = db.query(Catalyst).filter(Catalyst.id == catalyst_id).first()
-    if not catalyst:
+    if db.get(Catalyst, catalyst_id) is None:
         raise HTTPException(status_code=404, detail=f"Catalyst {catalyst_id} not found")
 
-    char = db.query(Characterization).filter(Characterization.id == characterization_id).first()
-    if not char:
+    if db.get(Characterization, characterization_id) is None:
         raise HTTPException(status_code=404, detail=f"Characterization {characterization_id} not found")
 
-    if char not in catalyst.characterizations:
-        catalyst.characterizations.append(char)
+    if add_association(
+            db, catalyst_characterization,
+            catalyst_id=catalyst_id,
+            characterization_id=characterization_id
+    ):
         db.commit()
 
     return None
@@ -431,16 +668,17 @@ def remove_characterization_from_catalyst(
 ):
     """Remove a characterization link."""
 
-    catalyst = db.query(Catalyst).filter(Catalyst.id == catalyst_id).first()
-    if not catalyst:
+    if db.get(Catalyst, catalyst_id) is None:
         raise HTTPException(status_code=404, detail=f"Catalyst {catalyst_id} not found")
 
-    char = db.query(Characterization).filter(Characterization.id == characterization_id).first()
-    if not char:
+    if db.get(Characterization, characterization_id) is None:
         raise HTTPException(status_code=404, detail=f"Characterization {characterization_id} not found")
 
-    if char in catalyst.characterizations:
-        catalyst.characterizations.remove(char)
+    if remove_association(
+            db, catalyst_characterization,
+            catalyst_id=catalyst_id,
+            characterization_id=characterization_id
+    ):
         db.commit()
 
     return None
@@ -455,16 +693,17 @@ def add_observation_to_catalyst(
 ):
     """Link an observation to this catalyst."""
 
-    catalyst = db.query(Catalyst).filter(Catalyst.id == catalyst_id).first()
-    if not catalyst:
+    if db.get(Catalyst, catalyst_id) is None:
         raise HTTPException(status_code=404, detail=f"Catalyst {catalyst_id} not found")
 
-    obs = db.query(Observation).filter(Observation.id == observation_id).first()
-    if not obs:
+    if db.get(Observation, observation_id) is None:
         raise HTTPException(status_code=404, detail=f"Observation {observation_id} not found")
 
-    if obs not in catalyst.observations:
-        catalyst.observations.append(obs)
+    if add_association(
+            db, catalyst_observation,
+            catalyst_id=catalyst_id,
+            observation_id=observation_id
+    ):
         db.commit()
 
     return None
@@ -479,16 +718,17 @@ def remove_observation_from_catalyst(
 ):
     """Remove an observation link."""
 
-    catalyst = db.query(Catalyst).filter(Catalyst.id == catalyst_id).first()
-    if not catalyst:
+    if db.get(Catalyst, catalyst_id) is None:
         raise HTTPException(status_code=404, detail=f"Catalyst {catalyst_id} not found")
 
-    obs = db.query(Observation).filter(Observation.id == observation_id).first()
-    if not obs:
+    if db.get(Observation, observation_id) is None:
         raise HTTPException(status_code=404, detail=f"Observation {observation_id} not found")
 
-    if obs in catalyst.observations:
-        catalyst.observations.remove(obs)
+    if remove_association(
+            db, catalyst_observation,
+            catalyst_id=catalyst_id,
+            observation_id=observation_id
+    ):
         db.commit()
 
     return None
@@ -503,16 +743,17 @@ def add_user_to_catalyst(
 ):
     """Record that a user worked on this catalyst."""
 
-    catalyst = db.query(Catalyst).filter(Catalyst.id == catalyst_id).first()
-    if not catalyst:
+    if db.get(Catalyst, catalyst_id) is None:
         raise HTTPException(status_code=404, detail=f"Catalyst {catalyst_id} not found")
 
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    if db.get(User, user_id) is None:
         raise HTTPException(status_code=404, detail=f"User {user_id} not found")
 
-    if user not in catalyst.users:
-        catalyst.users.append(user)
+    if add_association(
+            db, user_catalyst,
+            user_id=user_id,
+            catalyst_id=catalyst_id
+    ):
         db.commit()
 
     return None
@@ -527,16 +768,17 @@ def remove_user_from_catalyst(
 ):
     """Remove a user's association with this catalyst."""
 
-    catalyst = db.query(Catalyst).filter(Catalyst.id == catalyst_id).first()
-    if not catalyst:
+    if db.get(Catalyst, catalyst_id) is None:
         raise HTTPException(status_code=404, detail=f"Catalyst {catalyst_id} not found")
 
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    if db.get(User, user_id) is None:
         raise HTTPException(status_code=404, detail=f"User {user_id} not found")
 
-    if user in catalyst.users:
-        catalyst.users.remove(user)
+    if remove_association(
+            db, user_catalyst,
+            user_id=user_id,
+            catalyst_id=catalyst_id
+    ):
         db.commit()
 
     return None
@@ -13,12 +13,20 @@ Endpoint Summary:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session, joinedload
+from pydantic import TypeAdapter
+from sqlalchemy import select, delete, exists, func, lambda_stmt
+from sqlalchemy.orm import Session, selectinload, raiseload, undefer_group
 from sqlalchemy.exc import IntegrityError
 from typing import List, Optional
+from functools import lru_cache
 
 from app.database import get_db
+from app.routers.utils import (
+    name_search_filter, include_dependency, json_response,
+    NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
+)
 from app.models.catalysts.chemical import Chemical
+from app.models.catalysts.method import chemical_method
 from app.schemas.catalysts.chemical import (
     ChemicalCreate, ChemicalUpdate, ChemicalResponse
 )
@@ -28,58 +36,102 @@ router = APIRouter(
     tags=["Chemicals"]
 )
 
+# Prebuilt adapter for the list endpoint's JSON fast path
+_CHEMICAL_LIST_ADAPTER = TypeAdapter(List[ChemicalResponse])
+
+# ChemicalCreate fields copied onto the Chemical row; all are plain columns
+_CHEMICAL_COLUMN_FIELDS = tuple(ChemicalCreate.model_fields)
+
+# Loads the deferred method_count column serialized by ChemicalResponse
+_WITH_COUNTS = undefer_group('counts')
+
+
+# =============================================================================
+# Include Handling
+# =============================================================================
+
+# Loader option for each relationship that can be requested via ?include=.
+# Built once at import time; loader options are immutable and reusable.
+INCLUDE_OPTIONS = {
+    'methods': selectinload(Chemical.methods),
+}
+
+
+# Dependency yielding the validated set of requested relationships
+get_chemical_includes = include_dependency(INCLUDE_OPTIONS)
+
+
+@lru_cache(maxsize=16)
+def _include_options(include: frozenset) -> tuple:
+    """Loader options for a validated set of include names, cached per set."""
+    return tuple(
+        option for name, option in INCLUDE_OPTIONS.items()
+        if name in include
+    )
+
 
 @router.get("/", response_model=List[ChemicalResponse])
 def list_chemicals(
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=1000),
-        search: Optional[str] = Query(None, description="Search in name, formula, CAS"),
-        include: Optional[str] = Query(None, description="Relationships: methods"),
+        cursor: Optional[str] = Query(
+            None,
+            description="Resume after the last chemical of the previous page "
+                        "(value of the X-Next-Cursor response header)"
+        ),
+        search: Optional[str] = Query(None, description="Search in chemical names (append * for a prefix match)"),
+        include: frozenset = Depends(get_chemical_includes),
         db: Session = Depends(get_db)
 ):
     """
     List chemicals with search and relationship inclusion.
     
-    Search matches against:
-    - Chemical name
-    - Molecular formula
-    - CAS number
+    Search matches against the chemical name. Results are ordered by
+    name; when a page is full, the X-Next-Cursor header holds a cursor
+    that continues after the last name via the unique name index.
     """
 
-    query = db.query(Chemical)
+    # Built as a lambda statement: each criteria lambda is cached on its
+    # code location, so a request only binds new parameter values instead
+    # of constructing and cache-keying the whole statement again
+    stmt = lambda_stmt(lambda: select(Chemical))
 
-    if search:
-        search_pattern = f"%{search}%"
-        query = query.filter(
-            (Chemical.name.ilike(search_pattern)) |
-            (Chemical.formula.ilike(search_pattern)) |
-            (Chemical.cas_number.ilike(search_pattern))
-        )
+    if cursor:
+        (last_name,) = decode_cursor(cursor, 1)
+        stmt += lambda s: s.where(Chemical.name > last_name)
 
-    if include and 'methods' in include:
-        query = query.options(joinedload(Chemical.methods))
+    search_clause = name_search_filter(Chemical.name, search)
+    if search_clause is not None:
+        stmt += lambda s: s.where(search_clause)
 
-    query = query.order_by(Chemical.name)
+    # Any relationship that was not requested raises instead of lazy loading
+    options = _include_options(include) + (_WITH_COUNTS, raiseload('*'))
+    stmt += lambda s: s.options(*options)
 
-    return query.offset(skip).limit(limit).all()
+    stmt += lambda s: s.order_by(Chemical.name).offset(skip).limit(limit)
+
+    chemicals = db.scalars(stmt).all()
+
+    headers = None
+    if len(chemicals) == limit:
+        headers = {NEXT_CURSOR_HEADER: encode_cursor(chemicals[-1].name)}
+
+    return json_response(_CHEMICAL_LIST_ADAPTER, chemicals, headers=headers)
 
 
 @router.get("/{chemical_id}", response_model=ChemicalResponse)
 def get_chemical(
         chemical_id: int,
-        include: Optional[str] = Query(None),
+        include: frozenset = Depends(get_chemical_includes),
         db: Session = Depends(get_db)
 ):
     """
     Retrieve a single chemical by ID.
     """
 
-    query = db.query(Chemical)
-
-    if include and 'methods' in include:
-        query = query.options(joinedload(Chemical.methods))
-
-    chemical = query.filter(Chemical.id == chemical_id).first()
+    # Any relationship that was not requested raises instead of lazy loading
+    options = _include_options(include) + (_WITH_COUNTS, raiseload('*'))
+    chemical = db.get(Chemical, chemical_id, options=options)
 
     if chemical is None:
         raise HTTPException(
@@ -98,31 +150,31 @@ def create_chemical(
     """
     Create a new chemical.
     
-    Chemical names must be unique.
+    Chemical names must be unique, ignoring case and surrounding
+    whitespace. Uniqueness is enforced by the database indexes alone; a
+    duplicate surfaces as IntegrityError on commit, so the common case
+    needs no extra lookup.
     """
 
-    # Check for duplicate name
-    existing = db.query(Chemical).filter(Chemical.name == chemical.name).first()
-    if existing:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Chemical with name '{chemical.name}' already exists"
-        )
-
-    db_chemical = Chemical(**chemical.model_dump())
+    db_chemical = Chemical(**{
+        field: getattr(chemical, field) for field in _CHEMICAL_COLUMN_FIELDS
+    })
     db.add(db_chemical)
 
     try:
+        db.flush()
+        chemical_id = db_chemical.id
         db.commit()
-        db.refresh(db_chemical)
     except IntegrityError:
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Chemical with this name already exists"
+            detail=f"Chemical with name '{chemical.name}' already exists"
         )
 
-    return db_chemical
+    # refresh() would leave method_count deferred; reload it in the same
+    # SELECT instead
+    return db.get(Chemical, chemical_id, options=[_WITH_COUNTS], populate_existing=True)
 
 
 @router.patch("/{chemical_id}", response_model=ChemicalResponse)
@@ -135,7 +187,7 @@ def update_chemical(
     Update a chemical with partial data.
     """
 
-    db_chemical = db.query(Chemical).filter(Chemical.id == chemical_id).first()
+    db_chemical = db.get(Chemical, chemical_id)
 
     if db_chemical is None:
         raise HTTPException(
@@ -145,25 +197,22 @@ def update_chemical(
 
     update_data = chemical_update.model_dump(exclude_unset=True)
 
-    # Check for name uniqueness if updating name
-    if 'name' in update_data:
-        existing = db.query(Chemical).filter(
-            Chemical.name == update_data['name'],
-            Chemical.id != chemical_id
-        ).first()
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Chemical with name '{update_data['name']}' already exists"
-            )
-
     for field, value in update_data.items():
         setattr(db_chemical, field, value)
 
-    db.commit()
-    db.refresh(db_chemical)
+    # A name clash is caught by the unique constraint on commit
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Chemical with name '{update_data.get('name')}' already exists"
+        )
 
-    return db_chemical
+    # refresh() would leave method_count deferred; reload it in the same
+    # SELECT instead
+    return db.get(Chemical, chemical_id, options=[_WITH_COUNTS], populate_existing=True)
 
 
 @router.delete("/{chemical_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -176,24 +225,44 @@ def delete_chemical(
     Delete a chemical.
     
     Fails if the chemical is used by any methods unless force=True.
-    """
 
-    db_chemical = db.query(Chemical).filter(Chemical.id == chemical_id).first()
+    The in-use check is part of the DELETE itself, so the methods
+    collection is never loaded; chemical_method links are removed by
+    ON DELETE CASCADE. Only when nothing was deleted is a follow-up
+    query needed to report why.
+    """
 
-    if db_chemical is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Chemical with ID {chemical_id} not found"
+    stmt = delete(Chemical).where(Chemical.id == chemical_id)
+    if not force:
+        stmt = stmt.where(
+            ~exists().where(chemical_method.c.chemical_id == chemical_id)
         )
 
-    if not force and db_chemical.is_in_use:
+    result = db.execute(stmt.execution_options(synchronize_session=False))
+
+    if result.rowcount == 0:
+        exists_row, method_count = db.execute(
+            select(
+                select(Chemical.id).where(Chemical.id == chemical_id).exists(),
+                select(func.count())
+                .select_from(chemical_method)
+                .where(chemical_method.c.chemical_id == chemical_id)
+                .scalar_subquery()
+            )
+        ).one()
+
+        if not exists_row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Chemical with ID {chemical_id} not found"
+            )
+
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Chemical is used by {db_chemical.method_count} methods. "
+            detail=f"Chemical is used by {method_count} methods. "
                    "Use force=true to delete anyway."
         )
 
-    db.delete(db_chemical)
     db.commit()
 
     return None
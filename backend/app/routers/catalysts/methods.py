@@ -17,13 +17,24 @@ Endpoint Summary:
 - POST   /api/methods/{id}/history              Record a modification
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session, joinedload
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from pydantic import TypeAdapter
+from sqlalchemy import select, exists, insert, delete, literal, lambda_stmt, or_, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, selectinload, raiseload, undefer_group
+from typing import List, Optional, Set
+from functools import lru_cache
 
 from app.database import get_db
-from app.models.catalysts.method import Method, UserMethod
+from app.routers.utils import (
+    contains_pattern, LIKE_ESCAPE, add_association, remove_association,
+    include_dependency, dump_json_items, json_array_response,
+    NEXT_CURSOR_HEADER, encode_cursor, decode_created_at_cursor
+)
+from app.models.catalysts.method import Method, UserMethod, chemical_method
 from app.models.catalysts.chemical import Chemical
+from app.models.catalysts.catalyst import Catalyst
+from app.models.catalysts.sample import Sample
 from app.models.core.user import User
 from app.schemas.catalysts.method import (
     MethodCreate, MethodUpdate, MethodResponse,
@@ -35,82 +46,159 @@ router = APIRouter(
     tags=["Methods"]
 )
 
+# Prebuilt adapter for the list endpoint's JSON fast path
+_METHOD_LIST_ADAPTER = TypeAdapter(List[MethodResponse])
+
+# Rows fetched and serialized per batch by list_methods
+_LIST_PARTITION_SIZE = 100
+
+# Loads the deferred count columns that MethodResponse serializes
+_WITH_COUNTS = undefer_group('counts')
+
+# MethodCreate fields copied onto the Method row; chemical_ids is written
+# to the junction table separately
+_METHOD_COLUMN_FIELDS = tuple(
+    field for field in MethodCreate.model_fields if field != 'chemical_ids'
+)
+
+
+# =============================================================================
+# Include Handling
+# =============================================================================
+
+# Loader option for each relationship that can be requested via ?include=.
+# Built once at import time; loader options are immutable and reusable.
+INCLUDE_OPTIONS = {
+    'chemicals': selectinload(Method.chemicals),
+    'catalysts': selectinload(Method.catalysts),
+    'samples': selectinload(Method.samples),
+    'user_changes': selectinload(Method.user_changes).joinedload(UserMethod.user),
+}
+
+
+# Dependency yielding the validated set of requested relationships
+get_method_includes = include_dependency(INCLUDE_OPTIONS)
+
+
+@lru_cache(maxsize=16)
+def _include_options(include: frozenset) -> tuple:
+    """Loader options for a validated set of include names, cached per set."""
+    return tuple(
+        option for name, option in INCLUDE_OPTIONS.items()
+        if name in include
+    )
+
+
+# Name Postgres gives the foreign key from user_method.user_id to users
+_USER_METHOD_USER_FK = 'user_method_user_id_fkey'
+
+
+def _missing_chemical_ids(db: Session, chemical_ids: Set[int]) -> Set[int]:
+    """
+    Return the IDs in chemical_ids that have no chemicals row.
+
+    Only called after a failed junction insert to build the error
+    message; selects the id column alone, no Chemical rows are loaded.
+    """
+    if not chemical_ids:
+        return set()
+    return chemical_ids - set(db.scalars(
+        select(Chemical.id).where(Chemical.id.in_(chemical_ids))
+    ))
+
 
 @router.get("/", response_model=List[MethodResponse])
 def list_methods(
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=1000),
-        search: Optional[str] = Query(None, description="Search in name and procedure"),
-        is_active: Optional[bool] = Query(None, description="Filter by active status"),
-        include: Optional[str] = Query(
+        cursor: Optional[str] = Query(
             None,
-            description="Relationships: chemicals,catalysts,samples,user_changes"
+            description="Resume after the last method of the previous page "
+                        "(value of the X-Next-Cursor response header)"
         ),
+        search: Optional[str] = Query(None, description="Search in name and procedure"),
+        is_active: Optional[bool] = Query(None, description="Filter by active status"),
+        include: frozenset = Depends(get_method_includes),
         db: Session = Depends(get_db)
 ):
     """
     List methods with filtering and relationship inclusion.
-    """
 
-    query = db.query(Method)
+    Results are ordered newest first. When a page is full, the
+    X-Next-Cursor header holds a cursor for the next page; passing it
+    back as ``cursor`` continues from the last row via the
+    (created_at, id) index instead of counting past ``skip`` rows.
+    """
 
-    if search:
-        search_pattern = f"%{search}%"
-        query = query.filter(
-            (Method.descriptive_name.ilike(search_pattern)) |
-            (Method.procedure.ilike(search_pattern))
+    # Built as a lambda statement, like list_chemicals: each criteria
+    # lambda is cached on its code location, so a request only binds new
+    # parameter values instead of rebuilding and cache-keying the statement
+    stmt = lambda_stmt(lambda: select(Method))
+
+    if cursor:
+        created_at, last_id = decode_created_at_cursor(cursor)
+        cursor_clause = tuple_(Method.created_at, Method.id) < (created_at, last_id)
+        stmt += lambda s: s.where(cursor_clause)
+
+    search_pattern = contains_pattern(search)
+    if search_pattern:
+        search_clause = or_(
+            Method.descriptive_name.ilike(search_pattern, escape=LIKE_ESCAPE),
+            Method.procedure.ilike(search_pattern, escape=LIKE_ESCAPE)
         )
+        stmt += lambda s: s.where(search_clause)
 
     if is_active is not None:
-        query = query.filter(Method.is_active == is_active)
+        stmt += lambda s: s.where(Method.is_active == is_active)
 
-    if include:
-        include_rels = {rel.strip() for rel in include.split(',')}
+    options = _include_options(include) + (_WITH_COUNTS, raiseload('*'))
+    stmt += lambda s: s.options(*options)
 
-        if 'chemicals' in include_rels:
-            query = query.options(joinedload(Method.chemicals))
-        if 'catalysts' in include_rels:
-            query = query.options(joinedload(Method.catalysts))
-        if 'samples' in include_rels:
-            query = query.options(joinedload(Method.samples))
-        if 'user_changes' in include_rels:
-            query = query.options(joinedload(Method.user_changes))
+    stmt += lambda s: (
+        s.order_by(Method.created_at.desc(), Method.id.desc())
+        .offset(skip).limit(limit)
+    )
+
+    # Fetch and serialize one partition at a time, so at most
+    # _LIST_PARTITION_SIZE methods (and their included collections) are
+    # alive at once instead of the whole page
+    partitions = db.scalars(
+        stmt, execution_options={'yield_per': _LIST_PARTITION_SIZE}
+    ).partitions()
+
+    chunks = []
+    row_count = 0
+    last = None
+    for partition in partitions:
+        chunks.append(dump_json_items(_METHOD_LIST_ADAPTER, partition))
+        row_count += len(partition)
+        last = partition[-1]
+
+    headers = None
+    if row_count == limit:
+        headers = {NEXT_CURSOR_HEADER: encode_cursor(last.created_at, last.id)}
 
-    query = query.order_by(Method.created_at.desc())
+    # The page is fully encoded; hand the pooled connection back now
+    # rather than after the response has been sent
+    db.close()
 
-    return query.offset(skip).limit(limit).all()
+    return json_array_response(chunks, headers=headers)
 
 
 @router.get("/{method_id}", response_model=MethodResponse)
 def get_method(
         method_id: int,
-        include: Optional[str] = Query(
-            None,
-            description="Relationships: chemicals,catalysts,samples,user_changes"
-        ),
+        include: frozenset = Depends(get_method_includes),
         db: Session = Depends(get_db)
 ):
     """
     Retrieve a single method by ID.
     """
 
-    query = db.query(Method)
-
-    if include:
-        include_rels = {rel.strip() for rel in include.split(',')}
+    # Any relationship that was not requested raises instead of lazy loading
+    options = _include_options(include) + (_WITH_COUNTS, raiseload('*'))
 
-        if 'chemicals' in include_rels:
-            query = query.options(joinedload(Method.chemicals))
-        if 'catalysts' in include_rels:
-            query = query.options(joinedload(Method.catalysts))
-        if 'samples' in include_rels:
-            query = query.options(joinedload(Method.samples))
-        if 'user_changes' in include_rels:
-            query = query.options(
-                joinedload(Method.user_changes).joinedload(UserMethod.user)
-            )
-
-    method = query.filter(Method.id == method_id).first()
+    method = db.get(Method, method_id, options=options)
 
     if method is None:
         raise HTTPException(
@@ -128,31 +216,44 @@ def create_method(
 ):
     """
     Create a new synthesis method.
+
+    Chemical links are inserted straight into the junction table; the
+    foreign key on chemical_method rejects unknown chemical IDs, so the
+    common case needs no lookup. Only a failed insert is followed by a
+    query to report which IDs were missing.
     """
 
     # Create method
-    method_data = method.model_dump(exclude={'chemical_ids'})
-    db_method = Method(**method_data)
-
-    # Establish chemical relationships
-    if method.chemical_ids:
-        chemicals = db.query(Chemical).filter(
-            Chemical.id.in_(method.chemical_ids)
-        ).all()
-        found_ids = {c.id for c in chemicals}
-        missing_ids = set(method.chemical_ids) - found_ids
-        if missing_ids:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Chemical IDs not found: {sorted(missing_ids)}"
-            )
-        db_method.chemicals = chemicals
-
+    db_method = Method(**{
+        field: getattr(method, field) for field in _METHOD_COLUMN_FIELDS
+    })
     db.add(db_method)
-    db.commit()
-    db.refresh(db_method)
 
-    return db_method
+    chemical_ids = set(method.chemical_ids or ())
+
+    try:
+        db.flush()
+        method_id = db_method.id
+        if chemical_ids:
+            db.execute(
+                chemical_method.insert(),
+                [{'method_id': method_id, 'chemical_id': chemical_id}
+                 for chemical_id in sorted(chemical_ids)]
+            )
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        missing_ids = _missing_chemical_ids(db, chemical_ids)
+        if not missing_ids:
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Chemical IDs not found: {sorted(missing_ids)}"
+        )
+
+    # refresh() would leave the counts deferred; reload them in the same
+    # SELECT instead
+    return db.get(Method, method_id, options=[_WITH_COUNTS], populate_existing=True)
 
 
 @router.patch("/{method_id}", response_model=MethodResponse)
@@ -167,10 +268,11 @@ def update_method(
     Update a method with partial data.
     
     Optionally records who made the change and why via the user_method
-    audit table.
+    audit table. chemical_ids replaces the method's chemicals; unknown
+    IDs are rejected with 400.
     """
 
-    db_method = db.query(Method).filter(Method.id == method_id).first()
+    db_method = db.get(Method, method_id)
 
     if db_method is None:
         raise HTTPException(
@@ -180,32 +282,68 @@ def update_method(
 
     update_data = method_update.model_dump(exclude_unset=True)
 
-    # Handle chemical relationship updates
+    # Handle chemical relationship updates by diffing against the junction
+    # table, so only links that actually changed are written
+    added_ids = set()
+    removed_ids = set()
     if 'chemical_ids' in update_data:
         ids = update_data.pop('chemical_ids')
         if ids is not None:
-            chemicals = db.query(Chemical).filter(Chemical.id.in_(ids)).all()
-            db_method.chemicals = chemicals
+            requested_ids = set(ids)
+            current_ids = set(db.scalars(
+                select(chemical_method.c.chemical_id)
+                .where(chemical_method.c.method_id == method_id)
+            ))
+            added_ids = requested_ids - current_ids
+            removed_ids = current_ids - requested_ids
 
     # Update scalar fields
     for field, value in update_data.items():
         setattr(db_method, field, value)
 
-    # Record the change in audit table if user provided
+    # Record the change in audit table if user provided. The foreign key
+    # rejects an unknown user, so no existence check is needed up front
     if user_id:
-        user = db.query(User).filter(User.id == user_id).first()
-        if user:
-            user_method = UserMethod(
-                user_id=user_id,
-                method_id=method_id,
-                change_notes=change_notes
+        user_method = UserMethod(
+            user_id=user_id,
+            method_id=method_id,
+            change_notes=change_notes
+        )
+        db.add(user_method)
+
+    try:
+        if removed_ids:
+            db.execute(
+                delete(chemical_method).where(
+                    chemical_method.c.method_id == method_id,
+                    chemical_method.c.chemical_id.in_(removed_ids)
+                )
             )
-            db.add(user_method)
-
-    db.commit()
-    db.refresh(db_method)
+        if added_ids:
+            db.execute(
+                chemical_method.insert(),
+                [{'method_id': method_id, 'chemical_id': chemical_id}
+                 for chemical_id in sorted(added_ids)]
+            )
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if _USER_METHOD_USER_FK in str(e.orig):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"User with ID {user_id} not found"
+            )
+        missing_ids = _missing_chemical_ids(db, added_ids)
+        if not missing_ids:
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Chemical IDs not found: {sorted(missing_ids)}"
+        )
 
-    return db_method
+    # refresh() would leave the counts deferred; reload them in the same
+    # SELECT instead
+    return db.get(Method, method_id, options=[_WITH_COUNTS], populate_existing=True)
 
 
 @router.delete("/{method_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -221,16 +359,25 @@ def delete_method(
     force=True is specified. Consider deactivating instead of deleting.
     """
 
-    db_method = db.query(Method).filter(Method.id == method_id).first()
+    # EXISTS stops at the first referencing row; the counts are only
+    # computed for the error message
+    method_exists, has_catalysts, has_samples = db.execute(
+        select(
+            exists().where(Method.id == method_id),
+            exists().where(Catalyst.method_id == method_id),
+            exists().where(Sample.method_id == method_id)
+        )
+    ).one()
 
-    if db_method is None:
+    if not method_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Method with ID {method_id} not found"
         )
 
     # Check if in use
-    if not force and db_method.is_in_use:
+    if not force and (has_catalysts or has_samples):
+        db_method = db.get(Method, method_id, options=[_WITH_COUNTS])
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Method is in use by {db_method.catalyst_count} catalysts and "
@@ -238,6 +385,8 @@ def delete_method(
                    "or consider deactivating instead (PATCH with is_active=false)."
         )
 
+    db_method = db.get(Method, method_id)
+
     db.delete(db_method)
     db.commit()
 
@@ -248,6 +397,27 @@ def delete_method(
 # Chemical Relationship Endpoints
 # =============================================================================
 
+def _raise_missing_link_end(db: Session, method_id: int, chemical_id: int) -> None:
+    """
+    Raise 404 if either end of a chemical_method link does not exist.
+
+    Both ends are checked with one EXISTS query. Returns normally when
+    both the method and the chemical exist.
+    """
+    method_exists, chemical_exists = db.execute(
+        select(
+            exists().where(Method.id == method_id),
+            exists().where(Chemical.id == chemical_id)
+        )
+    ).one()
+
+    if not method_exists:
+        raise HTTPException(status_code=404, detail=f"Method {method_id} not found")
+
+    if not chemical_exists:
+        raise HTTPException(status_code=404, detail=f"Chemical {chemical_id} not found")
+
+
 @router.post("/{method_id}/chemicals/{chemical_id}",
              status_code=status.HTTP_204_NO_CONTENT)
 def add_chemical_to_method(
@@ -257,19 +427,22 @@ def add_chemical_to_method(
 ):
     """
     Add a chemical to this method's list of required chemicals.
-    """
-
-    method = db.query(Method).filter(Method.id == method_id).first()
-    if not method:
-        raise HTTPException(status_code=404, detail=f"Method {method_id} not found")
 
-    chemical = db.query(Chemical).filter(Chemical.id == chemical_id).first()
-    if not chemical:
-        raise HTTPException(status_code=404, detail=f"Chemical {chemical_id} not found")
+    The foreign keys on chemical_method reject unknown IDs, so existence
+    is only checked after a failed insert to pick the 404 message.
+    """
 
-    if chemical not in method.chemicals:
-        method.chemicals.append(chemical)
-        db.commit()
+    try:
+        if add_association(
+                db, chemical_method,
+                method_id=method_id,
+                chemical_id=chemical_id
+        ):
+            db.commit()
+    except IntegrityError:
+        db.rollback()
+        _raise_missing_link_end(db, method_id, chemical_id)
+        raise
 
     return None
 
@@ -283,19 +456,19 @@ def remove_chemical_from_method(
 ):
     """
     Remove a chemical from this method's list.
-    """
-
-    method = db.query(Method).filter(Method.id == method_id).first()
-    if not method:
-        raise HTTPException(status_code=404, detail=f"Method {method_id} not found")
 
-    chemical = db.query(Chemical).filter(Chemical.id == chemical_id).first()
-    if not chemical:
-        raise HTTPException(status_code=404, detail=f"Chemical {chemical_id} not found")
+    Existence is only checked when no link was deleted, to tell a
+    missing method or chemical (404) from a link that was never there.
+    """
 
-    if chemical in method.chemicals:
-        method.chemicals.remove(chemical)
+    if remove_association(
+            db, chemical_method,
+            method_id=method_id,
+            chemical_id=chemical_id
+    ):
         db.commit()
+    else:
+        _raise_missing_link_end(db, method_id, chemical_id)
 
     return None
 
@@ -307,8 +480,14 @@ def remove_chemical_from_method(
 @router.get("/{method_id}/history", response_model=List[UserMethodResponse])
 def get_method_history(
         method_id: int,
+        response: Response,
         skip: int = Query(0, ge=0),
         limit: int = Query(50, ge=1, le=500),
+        cursor: Optional[str] = Query(
+            None,
+            description="Resume after the last entry of the previous page "
+                        "(value of the X-Next-Cursor response header)"
+        ),
         include_user: bool = Query(True, description="Include user details"),
         db: Session = Depends(get_db)
 ):
@@ -316,25 +495,39 @@ def get_method_history(
     Get the modification history for a method.
     
     Returns a list of all recorded modifications, showing who made changes
-    and why. Ordered by most recent first.
-    """
+    and why. Ordered by most recent first; when a page is full, the
+    X-Next-Cursor header holds a cursor that continues from the last entry
+    via the (method_id, changed_at, id) index.
 
-    # Verify method exists
-    method = db.query(Method).filter(Method.id == method_id).first()
-    if not method:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Method with ID {method_id} not found"
-        )
+    The method's existence is only checked when the page comes back
+    empty, so a method with history costs a single query.
+    """
 
     query = db.query(UserMethod).filter(UserMethod.method_id == method_id)
 
+    if cursor:
+        changed_at, last_id = decode_created_at_cursor(cursor)
+        query = query.filter(tuple_(UserMethod.changed_at, UserMethod.id) < (changed_at, last_id))
+
     if include_user:
         query = query.options(joinedload(UserMethod.user))
 
-    query = query.order_by(UserMethod.changed_at.desc())
+    query = query.order_by(UserMethod.changed_at.desc(), UserMethod.id.desc())
+
+    entries = query.offset(skip).limit(limit).all()
+
+    # An empty page is either no (more) history or an unknown method
+    if not entries and not db.scalar(select(exists().where(Method.id == method_id))):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Method with ID {method_id} not found"
+        )
+
+    if len(entries) == limit:
+        last = entries[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.changed_at, last.id)
 
-    return query.offset(skip).limit(limit).all()
+    return entries
 
 
 @router.post("/{method_id}/history", response_model=UserMethodResponse,
@@ -352,34 +545,41 @@ def record_method_modification(
     the automatic recording done during PATCH operations.
     """
 
-    # Verify method exists
-    method = db.query(Method).filter(Method.id == method_id).first()
-    if not method:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Method with ID {method_id} not found"
+    # Insert only if both the method and the user exist. RETURNING hands
+    # back the new row as plain values, so the common path is a single
+    # round trip and nothing needs to be reloaded after the commit.
+    user_method = db.execute(
+        insert(UserMethod)
+        .from_select(
+            ['user_id', 'method_id', 'change_notes'],
+            select(
+                literal(modification.user_id, UserMethod.user_id.type),
+                literal(method_id, UserMethod.method_id.type),
+                literal(modification.change_notes, UserMethod.change_notes.type)
+            ).where(
+                exists().where(Method.id == method_id),
+                exists().where(User.id == modification.user_id)
+            )
         )
+        .returning(*UserMethod.__table__.columns)
+    ).mappings().first()
 
-    # Verify user exists
-    user = db.query(User).filter(User.id == modification.user_id).first()
-    if not user:
+    if user_method is None:
+        # Nothing inserted: find out which reference was missing
+        method_exists = db.scalar(select(exists().where(Method.id == method_id)))
+        if not method_exists:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Method with ID {method_id} not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"User with ID {modification.user_id} not found"
         )
 
-    # Create the modification record
-    user_method = UserMethod(
-        user_id=modification.user_id,
-        method_id=method_id,
-        change_notes=modification.change_notes
-    )
-
-    db.add(user_method)
     db.commit()
-    db.refresh(user_method)
 
-    return user_method
+    return dict(user_method)
 
 
 @router.delete("/{method_id}/history/{history_id}",
@@ -395,18 +595,21 @@ def delete_method_history_entry(
     Use with caution - this removes audit trail information.
     """
 
-    entry = db.query(UserMethod).filter(
-        UserMethod.id == history_id,
-        UserMethod.method_id == method_id
-    ).first()
+    # Single DELETE; no matching row means the entry does not exist or
+    # belongs to another method
+    result = db.execute(
+        delete(UserMethod).where(
+            UserMethod.id == history_id,
+            UserMethod.method_id == method_id
+        )
+    )
 
-    if not entry:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"History entry {history_id} not found for method {method_id}"
         )
 
-    db.delete(entry)
     db.commit()
 
     return None
@@ -26,13 +26,24 @@ Endpoint Summary:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select, exists, update, delete, func, literal, union_all, lambda_stmt, tuple_
+from sqlalchemy.orm import Session, joinedload, selectinload, raiseload
 from sqlalchemy.exc import IntegrityError
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 from decimal import Decimal
+from pydantic import TypeAdapter
+from functools import lru_cache
 
 from app.database import get_db
-from app.models.catalysts.sample import Sample
+from app.routers.utils import (
+    name_search_filter, add_association, remove_association,
+    include_dependency, json_response, dump_json_items, json_array_response,
+    append_consumption_note, NEXT_CURSOR_HEADER, encode_cursor,
+    decode_created_at_cursor
+)
+from app.models.catalysts.sample import (
+    Sample, sample_characterization, sample_observation, user_sample
+)
 from app.models.catalysts.catalyst import Catalyst
 from app.models.catalysts.support import Support
 from app.models.catalysts.method import Method
@@ -48,6 +59,99 @@ router = APIRouter(
     tags=["Samples"]
 )
 
+# Prebuilt adapters for the JSON fast path of list and single-sample
+# responses; response_model stays on the routes for the OpenAPI schema
+_SAMPLE_ADAPTER = TypeAdapter(SampleResponse)
+_SAMPLE_LIST_ADAPTER = TypeAdapter(List[SampleResponse])
+
+# Rows fetched and serialized per batch by list_samples
+_LIST_PARTITION_SIZE = 100
+
+# Link fields accepted on create/update: (payload field, target model,
+# junction table, junction column referencing the target)
+_SAMPLE_LINKS = (
+    ('characterization_ids', Characterization, sample_characterization, 'characterization_id'),
+    ('observation_ids', Observation, sample_observation, 'observation_id'),
+    ('user_ids', User, user_sample, 'user_id'),
+)
+
+_SAMPLE_LINK_FIELDS = frozenset(field for field, _, _, _ in _SAMPLE_LINKS)
+
+
+# Many-to-one references validated on create/update: (field, target model)
+_SAMPLE_REFERENCES = (
+    ('catalyst_id', Catalyst),
+    ('support_id', Support),
+    ('method_id', Method),
+)
+
+
+def _existing_ids(db: Session, requested: Dict[type, Set[int]]) -> Dict[type, Set[int]]:
+    """
+    Return which of the requested IDs exist, per model, in one round trip.
+
+    Each model contributes an id-only SELECT tagged with its table name;
+    the SELECTs are combined with UNION ALL.
+    """
+    requested = {model: ids for model, ids in requested.items() if ids}
+    existing = {model: set() for model in requested}
+    if not requested:
+        return existing
+
+    by_table = {model.__tablename__: model for model in requested}
+    lookups = [
+        select(literal(model.__tablename__), model.id).where(model.id.in_(ids))
+        for model, ids in requested.items()
+    ]
+    for table, found_id in db.execute(union_all(*lookups)):
+        existing[by_table[table]].add(found_id)
+    return existing
+
+
+def _insert_links(db: Session, junction, column: str, sample_id: int, ids: Set[int]) -> None:
+    """Insert junction rows linking a sample to ids in one executemany."""
+    if ids:
+        db.execute(
+            junction.insert(),
+            [{'sample_id': sample_id, column: target_id} for target_id in ids]
+        )
+
+
+# =============================================================================
+# Include Handling
+# =============================================================================
+
+# Loader option for each relationship that can be requested via ?include=.
+# Many-to-one relationships are joined into the main query; collections
+# are loaded with one extra SELECT ... IN each.
+INCLUDE_OPTIONS = {
+    'catalyst': joinedload(Sample.catalyst),
+    'support': joinedload(Sample.support),
+    'method': joinedload(Sample.method),
+    'characterizations': selectinload(Sample.characterizations),
+    'observations': selectinload(Sample.observations),
+    'experiments': selectinload(Sample.experiments),
+    'users': selectinload(Sample.users),
+}
+
+
+# Dependency yielding the validated set of requested relationships
+get_sample_includes = include_dependency(INCLUDE_OPTIONS)
+
+
+@lru_cache(maxsize=32)
+def _include_options(include: frozenset) -> tuple:
+    """
+    Loader options for a validated set of include names, cached per set.
+
+    raiseload('*') is appended so relationships that were not included
+    are never lazy loaded during serialization.
+    """
+    return tuple(
+        option for name, option in INCLUDE_OPTIONS.items()
+        if name in include
+    ) + (raiseload('*'),)
+
 
 # =============================================================================
 # List and Search
@@ -57,16 +161,17 @@ router = APIRouter(
 def list_samples(
         skip: int = Query(0, ge=0, description="Pagination offset"),
         limit: int = Query(100, ge=1, le=1000, description="Page size"),
+        cursor: Optional[str] = Query(
+            None,
+            description="Resume after the last sample of the previous page "
+                        "(value of the X-Next-Cursor response header)"
+        ),
         search: Optional[str] = Query(None, description="Search in sample names"),
         catalyst_id: Optional[int] = Query(None, description="Filter by source catalyst"),
         support_id: Optional[int] = Query(None, description="Filter by support material"),
         method_id: Optional[int] = Query(None, description="Filter by preparation method"),
         depleted: Optional[bool] = Query(None, description="Filter by depletion status"),
-        include: Optional[str] = Query(
-            None,
-            description="Relationships to include: catalyst,support,method,"
-                        "characterizations,observations,experiments,users"
-        ),
+        include: frozenset = Depends(get_sample_includes),
         db: Session = Depends(get_db)
 ):
     """
@@ -83,53 +188,81 @@ def list_samples(
     - include=catalyst: Load source catalyst data
     - include=support,method: Load multiple relationships
     - include=characterizations: Load characterization records
+
+    Many-to-one relationships are joined into the main query; collections
+    are loaded with one extra SELECT ... IN per collection so each related
+    row is transferred once instead of once per joined combination.
+
+    Results are ordered newest first. When a page is full, the
+    X-Next-Cursor header holds a cursor for the next page; passing it
+    back as ``cursor`` continues from the last row via the
+    (created_at, id) index instead of counting past ``skip`` rows.
     """
 
-    query = db.query(Sample)
+    # Built as a lambda statement: each criteria lambda is cached on its
+    # code location, so a request only binds new parameter values instead
+    # of rebuilding and cache-keying the statement
+    stmt = lambda_stmt(lambda: select(Sample))
+
+    if cursor:
+        created_at, last_id = decode_created_at_cursor(cursor)
+        cursor_clause = tuple_(Sample.created_at, Sample.id) < (created_at, last_id)
+        stmt += lambda s: s.where(cursor_clause)
 
     # Apply filters
-    if search:
-        query = query.filter(Sample.name.ilike(f"%{search}%"))
+    search_clause = name_search_filter(Sample.name, search)
+    if search_clause is not None:
+        stmt += lambda s: s.where(search_clause)
 
     if catalyst_id is not None:
-        query = query.filter(Sample.catalyst_id == catalyst_id)
+        stmt += lambda s: s.where(Sample.catalyst_id == catalyst_id)
 
     if support_id is not None:
-        query = query.filter(Sample.support_id == support_id)
+        stmt += lambda s: s.where(Sample.support_id == support_id)
 
     if method_id is not None:
-        query = query.filter(Sample.method_id == method_id)
+        stmt += lambda s: s.where(Sample.method_id == method_id)
 
     if depleted is not None:
         if depleted:
-            query = query.filter(Sample.remaining_amount <= 0.0001)
+            stmt += lambda s: s.where(Sample.remaining_amount <= 0.0001)
         else:
-            query = query.filter(Sample.remaining_amount > 0.0001)
-
-    # Apply eager loading based on include parameter
-    if include:
-        include_rels = {rel.strip() for rel in include.split(',')}
-
-        if 'catalyst' in include_rels:
-            query = query.options(joinedload(Sample.catalyst))
-        if 'support' in include_rels:
-            query = query.options(joinedload(Sample.support))
-        if 'method' in include_rels:
-            query = query.options(joinedload(Sample.method))
-        if 'characterizations' in include_rels:
-            query = query.options(joinedload(Sample.characterizations))
-        if 'observations' in include_rels:
-            query = query.options(joinedload(Sample.observations))
-        if 'experiments' in include_rels:
-            query = query.options(joinedload(Sample.experiments))
-        if 'users' in include_rels:
-            query = query.options(joinedload(Sample.users))
-
-    # Order by creation date (newest first)
-    query = query.order_by(Sample.created_at.desc())
-
-    samples = query.offset(skip).limit(limit).all()
-    return samples
+            stmt += lambda s: s.where(Sample.remaining_amount > 0.0001)
+
+    # Eager load the included relationships, nothing else
+    options = _include_options(include)
+    stmt += lambda s: s.options(*options)
+
+    # Order by creation date (newest first), id breaks ties for the cursor
+    stmt += lambda s: (
+        s.order_by(Sample.created_at.desc(), Sample.id.desc())
+        .offset(skip).limit(limit)
+    )
+
+    # Fetch and serialize one partition at a time, so at most
+    # _LIST_PARTITION_SIZE samples (and their included collections) are
+    # alive at once instead of the whole page
+    partitions = db.scalars(
+        stmt, execution_options={'yield_per': _LIST_PARTITION_SIZE}
+    ).partitions()
+
+    chunks = []
+    row_count = 0
+    last = None
+    for partition in partitions:
+        chunks.append(dump_json_items(_SAMPLE_LIST_ADAPTER, partition))
+        row_count += len(partition)
+        last = partition[-1]
+
+    headers = None
+    if row_count == limit:
+        headers = {NEXT_CURSOR_HEADER: encode_cursor(last.created_at, last.id)}
+
+    # The page is fully encoded; hand the pooled connection back now
+    # rather than after the response has been sent
+    db.close()
+
+    return json_array_response(chunks, headers=headers)
 
 
 # =============================================================================
@@ -139,35 +272,14 @@ def list_samples(
 @router.get("/{sample_id}", response_model=SampleResponse)
 def get_sample(
         sample_id: int,
-        include: Optional[str] = Query(None, description="Relationships to include"),
+        include: frozenset = Depends(get_sample_includes),
         db: Session = Depends(get_db)
 ):
     """
     Retrieve a single sample by ID with optional relationship inclusion.
     """
 
-    query = db.query(Sample)
-
-    # Apply eager loading
-    if include:
-        include_rels = {rel.strip() for rel in include.split(',')}
-
-        if 'catalyst' in include_rels:
-            query = query.options(joinedload(Sample.catalyst))
-        if 'support' in include_rels:
-            query = query.options(joinedload(Sample.support))
-        if 'method' in include_rels:
-            query = query.options(joinedload(Sample.method))
-        if 'characterizations' in include_rels:
-            query = query.options(joinedload(Sample.characterizations))
-        if 'observations' in include_rels:
-            query = query.options(joinedload(Sample.observations))
-        if 'experiments' in include_rels:
-            query = query.options(joinedload(Sample.experiments))
-        if 'users' in include_rels:
-            query = query.options(joinedload(Sample.users))
-
-    sample = query.filter(Sample.id == sample_id).first()
+    sample = db.get(Sample, sample_id, options=_include_options(include))
 
     if sample is None:
         raise HTTPException(
@@ -175,7 +287,7 @@ def get_sample(
             detail=f"Sample with ID {sample_id} not found"
         )
 
-    return sample
+    return json_response(_SAMPLE_ADAPTER, sample)
 
 
 @router.post("/", response_model=SampleResponse, status_code=status.HTTP_201_CREATED)
@@ -198,82 +310,53 @@ def create_sample(
     - Users (user_ids)
     """
 
-    # Validate foreign key references
-    if sample.catalyst_id:
-        catalyst = db.query(Catalyst).filter(Catalyst.id == sample.catalyst_id).first()
-        if not catalyst:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Catalyst with ID {sample.catalyst_id} not found"
-            )
-
-    if sample.support_id:
-        support = db.query(Support).filter(Support.id == sample.support_id).first()
-        if not support:
+    # Validate foreign key references and link targets in one query
+    requested = {
+        model: {getattr(sample, field)}
+        for field, model in _SAMPLE_REFERENCES if getattr(sample, field)
+    }
+    link_ids = {
+        field: set(getattr(sample, field) or ())
+        for field, _, _, _ in _SAMPLE_LINKS
+    }
+    for field, model, _, _ in _SAMPLE_LINKS:
+        requested[model] = link_ids[field]
+    existing = _existing_ids(db, requested)
+
+    for field, model in _SAMPLE_REFERENCES:
+        ref_id = getattr(sample, field)
+        if ref_id and ref_id not in existing[model]:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Support with ID {sample.support_id} not found"
+                detail=f"{model.__name__} with ID {ref_id} not found"
             )
 
-    if sample.method_id:
-        method = db.query(Method).filter(Method.id == sample.method_id).first()
-        if not method:
+    for field, model, _, _ in _SAMPLE_LINKS:
+        missing_ids = link_ids[field] - existing.get(model, set())
+        if missing_ids:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Method with ID {sample.method_id} not found"
+                detail=f"{model.__name__} IDs not found: {sorted(missing_ids)}"
             )
 
     # Create sample instance (exclude relationship IDs)
-    sample_data = sample.model_dump(exclude={
-        'characterization_ids', 'observation_ids', 'user_ids'
-    })
+    sample_data = sample.model_dump(exclude=_SAMPLE_LINK_FIELDS)
     db_sample = Sample(**sample_data)
+    db.add(db_sample)
+    db.flush()
 
-    # Establish characterization relationships
-    if sample.characterization_ids:
-        characterizations = db.query(Characterization).filter(
-            Characterization.id.in_(sample.characterization_ids)
-        ).all()
-        found_ids = {c.id for c in characterizations}
-        missing_ids = set(sample.characterization_ids) - found_ids
-        if missing_ids:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Characterization IDs not found: {sorted(missing_ids)}"
-            )
-        db_sample.characterizations = characterizations
-
-    # Establish observation relationships
-    if sample.observation_ids:
-        observations = db.query(Observation).filter(
-            Observation.id.in_(sample.observation_ids)
-        ).all()
-        found_ids = {o.id for o in observations}
-        missing_ids = set(sample.observation_ids) - found_ids
-        if missing_ids:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Observation IDs not found: {sorted(missing_ids)}"
-            )
-        db_sample.observations = observations
+    # Write junction rows directly instead of populating collections
+    for field, _, junction, column in _SAMPLE_LINKS:
+        _insert_links(db, junction, column, db_sample.id, link_ids.get(field))
 
-    # Establish user relationships
-    if sample.user_ids:
-        users = db.query(User).filter(User.id.in_(sample.user_ids)).all()
-        found_ids = {u.id for u in users}
-        missing_ids = set(sample.user_ids) - found_ids
-        if missing_ids:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"User IDs not found: {sorted(missing_ids)}"
-            )
-        db_sample.users = users
-
-    db.add(db_sample)
+    # The INSERT returned the generated columns; build the response before
+    # commit expires them, so no reload SELECT is needed
+    response = json_response(
+        _SAMPLE_ADAPTER, db_sample, status_code=status.HTTP_201_CREATED
+    )
     db.commit()
-    db.refresh(db_sample)
 
-    return db_sample
+    return response
 
 
 @router.patch("/{sample_id}", response_model=SampleResponse)
@@ -292,7 +375,7 @@ def update_sample(
     - Relationship associations (characterization_ids, etc.)
     """
 
-    db_sample = db.query(Sample).filter(Sample.id == sample_id).first()
+    db_sample = db.get(Sample, sample_id)
 
     if db_sample is None:
         raise HTTPException(
@@ -300,61 +383,60 @@ def update_sample(
             detail=f"Sample with ID {sample_id} not found"
         )
 
-    update_data = sample_update.model_dump(exclude_unset=True)
-
-    # Validate foreign key updates
-    if 'catalyst_id' in update_data and update_data['catalyst_id']:
-        catalyst = db.query(Catalyst).filter(
-            Catalyst.id == update_data['catalyst_id']
-        ).first()
-        if not catalyst:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Catalyst with ID {update_data['catalyst_id']} not found"
-            )
-
-    if 'support_id' in update_data and update_data['support_id']:
-        support = db.query(Support).filter(
-            Support.id == update_data['support_id']
-        ).first()
-        if not support:
+    # Drop fields whose value would not change, so idempotent PATCHes
+    # neither write nor re-validate them
+    update_data = {
+        field: value
+        for field, value in sample_update.model_dump(exclude_unset=True).items()
+        if field in _SAMPLE_LINK_FIELDS or getattr(db_sample, field) != value
+    }
+
+    # Validate foreign key updates and look up link targets in one query
+    requested = {
+        model: {update_data[field]}
+        for field, model in _SAMPLE_REFERENCES if update_data.get(field)
+    }
+    link_ids = {}
+    for field, model, _, _ in _SAMPLE_LINKS:
+        ids = update_data.pop(field, None)
+        if ids is not None:
+            link_ids[field] = requested[model] = set(ids)
+    existing = _existing_ids(db, requested)
+
+    for field, model in _SAMPLE_REFERENCES:
+        ref_id = update_data.get(field)
+        if ref_id and ref_id not in existing[model]:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Support with ID {update_data['support_id']} not found"
+                detail=f"{model.__name__} with ID {ref_id} not found"
             )
 
-    if 'method_id' in update_data and update_data['method_id']:
-        method = db.query(Method).filter(
-            Method.id == update_data['method_id']
-        ).first()
-        if not method:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Method with ID {update_data['method_id']} not found"
+    # Replace links by diffing against the junction table, so only links
+    # that actually changed are written and unchanged user_sample rows keep
+    # their changed_at; unknown IDs are ignored, as before
+    links_changed = False
+    for field, model, junction, column in _SAMPLE_LINKS:
+        if field not in link_ids:
+            continue
+        requested_ids = link_ids[field] & existing.get(model, set())
+        current_ids = set(db.scalars(
+            select(junction.c[column]).where(junction.c.sample_id == sample_id)
+        ))
+        removed_ids = current_ids - requested_ids
+        added_ids = requested_ids - current_ids
+        links_changed = links_changed or bool(removed_ids or added_ids)
+        if removed_ids:
+            db.execute(
+                delete(junction).where(
+                    junction.c.sample_id == sample_id,
+                    junction.c[column].in_(removed_ids)
+                )
             )
+        _insert_links(db, junction, column, sample_id, added_ids)
 
-    # Handle relationship updates
-    if 'characterization_ids' in update_data:
-        char_ids = update_data.pop('characterization_ids')
-        if char_ids is not None:
-            characterizations = db.query(Characterization).filter(
-                Characterization.id.in_(char_ids)
-            ).all()
-            db_sample.characterizations = characterizations
-
-    if 'observation_ids' in update_data:
-        obs_ids = update_data.pop('observation_ids')
-        if obs_ids is not None:
-            observations = db.query(Observation).filter(
-                Observation.id.in_(obs_ids)
-            ).all()
-            db_sample.observations = observations
-
-    if 'user_ids' in update_data:
-        user_ids_list = update_data.pop('user_ids')
-        if user_ids_list is not None:
-            users = db.query(User).filter(User.id.in_(user_ids_list)).all()
-            db_sample.users = users
+    # Nothing to write: answer from the loaded row without a commit
+    if not update_data and not links_changed:
+        return json_response(_SAMPLE_ADAPTER, db_sample)
 
     # Update scalar fields
     for field, value in update_data.items():
@@ -367,10 +449,13 @@ def update_sample(
             detail="remaining_amount cannot exceed yield_amount"
         )
 
+    # The UPDATE returns the trigger-set updated_at; build the response
+    # before commit expires the instance
+    db.flush()
+    response = json_response(_SAMPLE_ADAPTER, db_sample)
     db.commit()
-    db.refresh(db_sample)
 
-    return db_sample
+    return response
 
 
 @router.delete("/{sample_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -386,15 +471,15 @@ def delete_sample(
     junction tables.
     """
 
-    db_sample = db.query(Sample).filter(Sample.id == sample_id).first()
+    # Single DELETE; the junction rows go with it through ON DELETE CASCADE
+    result = db.execute(delete(Sample).where(Sample.id == sample_id))
 
-    if db_sample is None:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Sample with ID {sample_id} not found"
         )
 
-    db.delete(db_sample)
     db.commit()
 
     return None
@@ -407,7 +492,13 @@ def delete_sample(
 @router.patch("/{sample_id}/consume", response_model=SampleResponse)
 def consume_sample_material(
         sample_id: int,
-        amount: Decimal = Query(..., gt=0, description="Amount to consume"),
+        amount: Decimal = Query(
+            ...,
+            gt=0,
+            max_digits=8,
+            decimal_places=4,
+            description="Amount to consume, at the inventory column's precision"
+        ),
         notes: Optional[str] = Query(None, description="Notes about consumption"),
         db: Session = Depends(get_db)
 ):
@@ -421,71 +512,101 @@ def consume_sample_material(
     - Returns clear error if sample is depleted
     """
 
-    db_sample = db.query(Sample).filter(Sample.id == sample_id).first()
+    # Check and subtract in one conditional UPDATE, so concurrent requests
+    # cannot both pass the check and consume more than is left
+    values = {'remaining_amount': Sample.remaining_amount - amount}
 
-    if db_sample is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Sample with ID {sample_id} not found"
-        )
+    # Optionally append consumption note inside the same UPDATE, dated
+    # with the transaction's date rather than the previous updated_at
+    if notes:
+        values['notes'] = append_consumption_note(Sample.notes, amount, notes)
 
-    current_amount = Decimal(str(db_sample.remaining_amount))
+    db_sample = db.scalar(
+        update(Sample)
+        .where(Sample.id == sample_id, Sample.remaining_amount >= amount)
+        .values(**values)
+        .returning(Sample)
+    )
 
-    if amount > current_amount:
+    if db_sample is None:
+        # Nothing updated: either no such sample or not enough material
+        current_amount = db.scalar(
+            select(Sample.remaining_amount).where(Sample.id == sample_id)
+        )
+        if current_amount is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Sample with ID {sample_id} not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Cannot consume {amount}g - only {current_amount}g remaining"
         )
 
-    db_sample.remaining_amount = current_amount - amount
-
-    # Optionally append consumption note
-    if notes:
-        existing_notes = db_sample.notes or ""
-        timestamp = db_sample.updated_at.strftime("%Y-%m-%d")
-        consumption_note = f"\n[{timestamp}] Consumed {amount}g: {notes}"
-        db_sample.notes = existing_notes + consumption_note
-
+    # RETURNING populated the instance; build the response before commit
+    # expires it
+    response = json_response(_SAMPLE_ADAPTER, db_sample)
     db.commit()
-    db.refresh(db_sample)
 
-    return db_sample
+    return response
 
 
 # =============================================================================
 # Relationship Management Endpoints
 # =============================================================================
 
-@router.post("/{sample_id}/characterizations/{characterization_id}",
-             status_code=status.HTTP_204_NO_CONTENT)
-def add_characterization_to_sample(
-        sample_id: int,
-        characterization_id: int,
-        db: Session = Depends(get_db)
-):
+def _raise_missing_link_end(db: Session, sample_id: int, model: type, target_id: int) -> None:
     """
-    Link a characterization to this sample.
+    Raise 404 if the sample or the link target does not exist.
+
+    Both ends are checked with one EXISTS query. Returns normally when
+    both exist.
     """
+    sample_exists, target_exists = db.execute(
+        select(
+            exists().where(Sample.id == sample_id),
+            exists().where(model.id == target_id)
+        )
+    ).one()
 
-    sample = db.query(Sample).filter(Sample.id == sample_id).first()
-    if not sample:
+    if not sample_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Sample {sample_id} not found"
         )
 
-    characterization = db.query(Characterization).filter(
-        Characterization.id == characterization_id
-    ).first()
-    if not characterization:
+    if not target_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Characterization {characterization_id} not found"
+            detail=f"{model.__name__} {target_id} not found"
         )
 
-    if characterization not in sample.characterizations:
-        sample.characterizations.append(characterization)
-        db.commit()
+
+@router.post("/{sample_id}/characterizations/{characterization_id}",
+             status_code=status.HTTP_204_NO_CONTENT)
+def add_characterization_to_sample(
+        sample_id: int,
+        characterization_id: int,
+        db: Session = Depends(get_db)
+):
+    """
+    Link a characterization to this sample.
+
+    The junction's foreign keys reject unknown IDs, so existence is only
+    checked after a failed insert to pick the 404 message.
+    """
+
+    try:
+        if add_association(
+                db, sample_characterization,
+                sample_id=sample_id,
+                characterization_id=characterization_id
+        ):
+            db.commit()
+    except IntegrityError:
+        db.rollback()
+        _raise_missing_link_end(db, sample_id, Characterization, characterization_id)
+        raise
 
     return None
 
@@ -499,27 +620,19 @@ def remove_characterization_from_sample(
 ):
     """
     Remove a characterization link from this sample.
-    """
 
-    sample = db.query(Sample).filter(Sample.id == sample_id).first()
-    if not sample:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Sample {sample_id} not found"
-        )
-
-    characterization = db.query(Characterization).filter(
-        Characterization.id == characterization_id
-    ).first()
-    if not characterization:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Characterization {characterization_id} not found"
-        )
+    Existence is only checked when no link was deleted, to tell a missing
+    sample or characterization (404) from a link that was never there.
+    """
 
-    if characterization in sample.characterizations:
-        sample.characterizations.remove(characterization)
+    if remove_association(
+            db, sample_characterization,
+            sample_id=sample_id,
+            characterization_id=characterization_id
+    ):
         db.commit()
+    else:
+        _raise_missing_link_end(db, sample_id, Characterization, characterization_id)
 
     return None
 
@@ -535,25 +648,17 @@ def add_observation_to_sample(
     Link an observation to this sample.
     """
 
-    sample = db.query(Sample).filter(Sample.id == sample_id).first()
-    if not sample:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Sample {sample_id} not found"
-        )
-
-    observation = db.query(Observation).filter(
-        Observation.id == observation_id
-    ).first()
-    if not observation:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Observation {observation_id} not found"
-        )
-
-    if observation not in sample.observations:
-        sample.observations.append(observation)
-        db.commit()
+    try:
+        if add_association(
+                db, sample_observation,
+                sample_id=sample_id,
+                observation_id=observation_id
+        ):
+            db.commit()
+    except IntegrityError:
+        db.rollback()
+        _raise_missing_link_end(db, sample_id, Observation, observation_id)
+        raise
 
     return None
 
@@ -569,25 +674,14 @@ def remove_observation_from_sample(
     Remove an observation link from this sample.
     """
 
-    sample = db.query(Sample).filter(Sample.id == sample_id).first()
-    if not sample:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Sample {sample_id} not found"
-        )
-
-    observation = db.query(Observation).filter(
-        Observation.id == observation_id
-    ).first()
-    if not observation:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Observation {observation_id} not found"
-        )
-
-    if observation in sample.observations:
-        sample.observations.remove(observation)
+    if remove_association(
+            db, sample_observation,
+            sample_id=sample_id,
+            observation_id=observation_id
+    ):
         db.commit()
+    else:
+        _raise_missing_link_end(db, sample_id, Observation, observation_id)
 
     return None
 
@@ -603,23 +697,17 @@ def add_user_to_sample(
     Record that a user worked on this sample.
     """
 
-    sample = db.query(Sample).filter(Sample.id == sample_id).first()
-    if not sample:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Sample {sample_id} not found"
-        )
-
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"User {user_id} not found"
-        )
-
-    if user not in sample.users:
-        sample.users.append(user)
-        db.commit()
+    try:
+        if add_association(
+                db, user_sample,
+                sample_id=sample_id,
+                user_id=user_id
+        ):
+            db.commit()
+    except IntegrityError:
+        db.rollback()
+        _raise_missing_link_end(db, sample_id, User, user_id)
+        raise
 
     return None
 
@@ -635,22 +723,13 @@ def remove_user_from_sample(
     Remove a user's association with this sample.
     """
 
-    sample = db.query(Sample).filter(Sample.id == sample_id).first()
-    if not sample:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Sample {sample_id} not found"
-        )
-
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"User {user_id} not found"
-        )
-
-    if user in sample.users:
-        sample.users.remove(user)
+    if remove_association(
+            db, user_sample,
+            sample_id=sample_id,
+            user_id=user_id
+    ):
         db.commit()
+    else:
+        _raise_missing_link_end(db, sample_id, User, user_id)
 
     return None
\ No newline at end of file
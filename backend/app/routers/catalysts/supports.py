@@ -13,11 +13,13 @@ Endpoint Summary:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import or_
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import IntegrityError
 from typing import List, Optional
 
 from app.database import get_db
+from app.routers.utils import contains_pattern, LIKE_ESCAPE
 from app.models.catalysts.support import Support
 from app.schemas.catalysts.support import (
     SupportCreate, SupportUpdate, SupportResponse
@@ -28,6 +30,9 @@ router = APIRouter(
     tags=["Supports"]
 )
 
+# Name Postgres gives the unique constraint on supports.descriptive_name
+_SUPPORT_NAME_UNIQUE = 'supports_descriptive_name_key'
+
 
 @router.get("/", response_model=List[SupportResponse])
 def list_supports(
@@ -43,12 +48,13 @@ def list_supports(
 
     query = db.query(Support)
 
-    if search:
-        search_pattern = f"%{search}%"
-        query = query.filter(
-            (Support.descriptive_name.ilike(search_pattern)) |
-            (Support.description.ilike(search_pattern))
-        )
+    # Escaped substring pattern, served by the trigram indexes on both columns
+    search_pattern = contains_pattern(search)
+    if search_pattern:
+        query = query.filter(or_(
+            Support.descriptive_name.ilike(search_pattern, escape=LIKE_ESCAPE),
+            Support.description.ilike(search_pattern, escape=LIKE_ESCAPE)
+        ))
 
     if include and 'samples' in include:
         query = query.options(joinedload(Support.samples))
@@ -95,30 +101,28 @@ def create_support(
     Support names (descriptive_name) must be unique.
     """
 
-    # Check for duplicate name
-    existing = db.query(Support).filter(
-        Support.descriptive_name == support.descriptive_name
-    ).first()
-    if existing:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Support with name '{support.descriptive_name}' already exists"
-        )
-
     db_support = Support(**support.model_dump())
     db.add(db_support)
 
+    # The unique constraint on descriptive_name rejects duplicates, so
+    # there is no racy pre-check SELECT
     try:
-        db.commit()
-        db.refresh(db_support)
-    except IntegrityError:
+        db.flush()
+    except IntegrityError as e:
         db.rollback()
+        if _SUPPORT_NAME_UNIQUE not in str(e.orig):
+            raise
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Support with this name already exists"
+            detail=f"Support with name '{support.descriptive_name}' already exists"
         )
 
-    return db_support
+    # The INSERT returned the generated columns; build the response before
+    # commit expires them, so no reload SELECT is needed
+    response = SupportResponse.model_validate(db_support)
+    db.commit()
+
+    return response
 
 
 @router.patch("/{support_id}", response_model=SupportResponse)
@@ -131,7 +135,7 @@ def update_support(
     Update a support with partial data.
     """
 
-    db_support = db.query(Support).filter(Support.id == support_id).first()
+    db_support = db.get(Support, support_id)
 
     if db_support is None:
         raise HTTPException(
@@ -141,25 +145,26 @@ def update_support(
 
     update_data = support_update.model_dump(exclude_unset=True)
 
-    # Check for name uniqueness if updating name
-    if 'descriptive_name' in update_data:
-        existing = db.query(Support).filter(
-            Support.descriptive_name == update_data['descriptive_name'],
-            Support.id != support_id
-        ).first()
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Support with name '{update_data['descriptive_name']}' already exists"
-            )
-
     for field, value in update_data.items():
         setattr(db_support, field, value)
 
+    # The UPDATE returns the trigger-set updated_at; build the response
+    # before commit expires the instance. A name clash is reported by the
+    # unique constraint on descriptive_name.
+    try:
+        db.flush()
+    except IntegrityError as e:
+        db.rollback()
+        if _SUPPORT_NAME_UNIQUE not in str(e.orig):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Support with name '{update_data.get('descriptive_name')}' already exists"
+        )
+    response = SupportResponse.model_validate(db_support)
     db.commit()
-    db.refresh(db_support)
 
-    return db_support
+    return response
 
 
 @router.delete("/{support_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -174,7 +179,7 @@ def delete_support(
     Fails if the support is used by any samples unless force=True.
     """
 
-    db_support = db.query(Support).filter(Support.id == support_id).first()
+    db_support = db.get(Support, support_id)
 
     if db_support is None:
         raise HTTPException(
@@ -57,7 +57,7 @@ def get_user_activity_summary(
     """
 
     # Verify user exists
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -179,7 +179,7 @@ def get_user_catalyst_contributions(
     """
 
     # Verify user exists
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -222,7 +222,7 @@ def get_user_sample_contributions(
     Get all samples a user has contributed to.
     """
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -264,7 +264,7 @@ def get_user_characterization_contributions(
     Get all characterizations a user has performed.
     """
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -307,7 +307,7 @@ def get_user_observation_contributions(
     Get all observations a user has recorded.
     """
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -350,7 +350,7 @@ def get_user_experiment_contributions(
     Get all experiments a user has participated in.
     """
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -397,7 +397,7 @@ def get_catalyst_contributors(
     Get all users who have contributed to a catalyst.
     """
 
-    catalyst = db.query(Catalyst).filter(Catalyst.id == catalyst_id).first()
+    catalyst = db.get(Catalyst, catalyst_id)
     if not catalyst:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -445,7 +445,7 @@ def get_sample_contributors(
     Get all users who have contributed to a sample.
     """
 
-    sample = db.query(Sample).filter(Sample.id == sample_id).first()
+    sample = db.get(Sample, sample_id)
     if not sample:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -543,7 +543,7 @@ def get_observation_contributors(
     Get all users who have contributed to an observation.
     """
 
-    obs = db.query(Observation).filter(Observation.id == observation_id).first()
+    obs = db.get(Observation, observation_id)
     if not obs:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -136,7 +136,7 @@ def create_file(
 
     # Validate uploader if provided
     if file.uploaded_by:
-        uploader = db.query(User).filter(User.id == file.uploaded_by).first()
+        uploader = db.get(User, file.uploaded_by)
         if not uploader:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -169,7 +169,7 @@ def update_user(
     Update a user with partial data.
     """
 
-    db_user = db.query(User).filter(User.id == user_id).first()
+    db_user = db.get(User, user_id)
 
     if db_user is None:
         raise HTTPException(
@@ -225,7 +225,7 @@ def delete_user(
     force=True.
     """
 
-    db_user = db.query(User).filter(User.id == user_id).first()
+    db_user = db.get(User, user_id)
 
     if db_user is None:
         raise HTTPException(
@@ -258,7 +258,7 @@ def get_user_stats(
     Returns counts of each type of contribution.
     """
 
-    db_user = db.query(User).filter(User.id == user_id).first()
+    db_user = db.get(User, user_id)
 
     if db_user is None:
         raise HTTPException(
@@ -579,7 +579,7 @@ def add_sample_to_experiment(
             detail=f"Experiment with ID {experiment_id} not found"
         )
 
-    sample = db.query(Sample).filter(Sample.id == sample_id).first()
+    sample = db.get(Sample, sample_id)
     if not sample:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -613,7 +613,7 @@ def remove_sample_from_experiment(
             detail=f"Experiment with ID {experiment_id} not found"
         )
 
-    sample = db.query(Sample).filter(Sample.id == sample_id).first()
+    sample = db.get(Sample, sample_id)
     if not sample:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -715,7 +715,7 @@ def add_user_to_experiment(
             detail=f"Experiment with ID {experiment_id} not found"
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -749,7 +749,7 @@ def remove_user_from_experiment(
             detail=f"Experiment with ID {experiment_id} not found"
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -0,0 +1,306 @@
+"""
+Shared helpers for API routers.
+
+Small building blocks reused across domain routers, kept free of any
+entity-specific logic.
+"""
+
+import base64
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from fastapi import HTTPException, Query, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import Table, ColumnElement, delete, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+
+# =============================================================================
+# Search Helpers
+# =============================================================================
+
+# Escape character used in every LIKE pattern built by these helpers
+LIKE_ESCAPE = '\\'
+
+# Trailing marker that turns a search term into a prefix search ("Pt*")
+PREFIX_MARKER = '*'
+
+
+def _escape_like(term: str) -> str:
+    """Escape LIKE metacharacters so they are matched literally."""
+    return (
+        term.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace('%', LIKE_ESCAPE + '%')
+        .replace('_', LIKE_ESCAPE + '_')
+    )
+
+
+def contains_pattern(search: Optional[str]) -> Optional[str]:
+    """
+    Build a substring ILIKE pattern from user search input.
+
+    Returns None for missing or whitespace-only input so callers can skip
+    the filter entirely instead of matching every row against '%%'.
+    LIKE metacharacters in the input are escaped, so '%' and '_' are
+    matched literally. Use with ``column.ilike(pattern, escape=LIKE_ESCAPE)``.
+    """
+    if search is None:
+        return None
+
+    term = search.strip()
+    if not term:
+        return None
+
+    return f"%{_escape_like(term)}%"
+
+
+def name_search_filter(column: ColumnElement, search: Optional[str]) -> Optional[ColumnElement]:
+    """
+    Build a case-insensitive search predicate for a name column.
+
+    A term ending in ``*`` ("Pt*") is a prefix search and compiles to
+    ``lower(column) LIKE 'pt%'``, which a ``lower(column) text_pattern_ops``
+    B-tree index serves as a range scan. Any other term is a substring
+    search (``column ILIKE '%term%'``), served by the trigram index.
+    Returns None when there is nothing to filter on.
+    """
+    if search is None:
+        return None
+
+    term = search.strip()
+    if term.endswith(PREFIX_MARKER):
+        prefix = term.rstrip(PREFIX_MARKER).strip()
+        if not prefix:
+            return None
+        return func.lower(column).like(
+            _escape_like(prefix.lower()) + '%',
+            escape=LIKE_ESCAPE
+        )
+
+    pattern = contains_pattern(term)
+    if pattern is None:
+        return None
+    return column.ilike(pattern, escape=LIKE_ESCAPE)
+
+
+# =============================================================================
+# Include Parsing
+# =============================================================================
+
+@lru_cache(maxsize=256)
+def parse_include(include: str) -> frozenset:
+    """Split a comma-separated include string into a set of names."""
+    return frozenset(
+        name for name in (part.strip() for part in include.split(','))
+        if name
+    )
+
+
+def include_dependency(allowed: Iterable[str]) -> Callable[..., frozenset]:
+    """
+    Build a dependency that parses and validates the ``include`` parameter.
+
+    The dependency returns the requested relationship names as a
+    frozenset (empty when the parameter is absent). Unknown names are
+    rejected with 422 instead of being silently ignored. Parsing is
+    cached per distinct include string.
+    """
+    allowed_names = tuple(allowed)
+    allowed_set = frozenset(allowed_names)
+
+    def dependency(
+            include: Optional[str] = Query(
+                None,
+                description="Relationships: " + ",".join(allowed_names)
+            )
+    ) -> frozenset:
+        if not include:
+            return frozenset()
+
+        requested = parse_include(include)
+        unknown = requested - allowed_set
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail=f"Unknown include: {', '.join(sorted(unknown))}. "
+                       f"Allowed: {', '.join(allowed_names)}"
+            )
+        return requested
+
+    return dependency
+
+
+# =============================================================================
+# Pagination Helpers
+# =============================================================================
+
+# Response header carrying the cursor for the next page of a list endpoint
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+_CURSOR_SEPARATOR = '|'
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode the sort key of the last row on a page as an opaque cursor.
+
+    Values are stringified (datetimes as ISO 8601) and joined, then
+    base64url encoded so the cursor is safe to pass back as a query
+    parameter.
+    """
+    parts = [
+        value.isoformat() if isinstance(value, datetime) else str(value)
+        for value in values
+    ]
+    raw = _CURSOR_SEPARATOR.join(parts).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str, parts: int) -> List[str]:
+    """
+    Decode a cursor produced by encode_cursor() into its string parts.
+
+    The last part may itself contain the separator (e.g. a name), so the
+    string is only split parts - 1 times. Raises 400 for anything that is
+    not a well-formed cursor.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+    values = raw.split(_CURSOR_SEPARATOR, parts - 1)
+    if len(values) != parts:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+    return values
+
+
+def decode_created_at_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor(created_at, id).
+
+    Used by lists ordered newest first, which continue with
+    ``tuple_(Model.created_at, Model.id) < (created_at, id)``. Any
+    (timestamp, id) sort key works the same way, e.g. changed_at.
+    """
+    created_at, last_id = decode_cursor(cursor, 2)
+    try:
+        return datetime.fromisoformat(created_at), int(last_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+# =============================================================================
+# Association Helpers
+# =============================================================================
+
+def add_association(db: Session, junction: Table, **keys: int) -> bool:
+    """
+    Insert a junction row unless it already exists.
+
+    A single INSERT ... ON CONFLICT DO NOTHING, so concurrent requests
+    linking the same pair cannot both insert and fail on the primary key,
+    and the relationship collection is never loaded. Returns True when a
+    row was inserted; the caller is responsible for committing.
+    """
+    result = db.execute(
+        pg_insert(junction).values(**keys).on_conflict_do_nothing()
+    )
+    return result.rowcount > 0
+
+
+def remove_association(db: Session, junction: Table, **keys: int) -> bool:
+    """
+    Delete a junction row if present, without loading the collection.
+
+    Returns True when a row was deleted; the caller is responsible for
+    committing.
+    """
+    conditions = [junction.c[column] == value for column, value in keys.items()]
+    result = db.execute(delete(junction).where(*conditions))
+    return result.rowcount > 0
+
+
+# =============================================================================
+# Inventory Helpers
+# =============================================================================
+
+def append_consumption_note(notes_column: ColumnElement, amount: Decimal, notes: str) -> ColumnElement:
+    """
+    SQL expression appending a dated consumption line to a notes column.
+
+    Used as the UPDATE value of the consume endpoints, so the existing
+    notes never travel to the app. The date is the database's current
+    date, formatted explicitly as YYYY-MM-DD.
+    """
+    return (
+        func.coalesce(notes_column, '')
+        + '\n['
+        + func.to_char(func.current_date(), 'YYYY-MM-DD')
+        + f"] Consumed {amount}g: {notes}"
+    )
+
+
+# =============================================================================
+# Response Serialization
+# =============================================================================
+
+def json_response(
+        adapter: TypeAdapter,
+        data: Any,
+        status_code: int = 200,
+        headers: Optional[dict] = None
+) -> Response:
+    """
+    Validate ORM data with a prebuilt TypeAdapter and encode it to JSON.
+
+    Pydantic's core serializer writes the JSON bytes directly, skipping
+    the intermediate dict and json.dumps pass of the default response
+    path. Endpoints keep their response_model for the OpenAPI schema.
+    """
+    validated = adapter.validate_python(data, from_attributes=True)
+    return Response(
+        content=adapter.dump_json(validated),
+        media_type="application/json",
+        status_code=status_code,
+        headers=headers
+    )
+
+
+def dump_json_items(adapter: TypeAdapter, items: Any) -> bytes:
+    """
+    Serialize one chunk of a list response without the enclosing brackets.
+
+    ``adapter`` must be a TypeAdapter for a List type. Chunks produced
+    this way are joined by json_array_response(), so a large result can
+    be serialized partition by partition and each partition's ORM
+    objects and models released before the next one is loaded.
+    """
+    validated = adapter.validate_python(items, from_attributes=True)
+    return adapter.dump_json(validated)[1:-1]
+
+
+def json_array_response(
+        chunks: List[bytes],
+        status_code: int = 200,
+        headers: Optional[dict] = None
+) -> Response:
+    """Join chunks from dump_json_items() into a JSON array response."""
+    return Response(
+        content=b'[' + b','.join(chunk for chunk in chunks if chunk) + b']',
+        media_type="application/json",
+        status_code=status_code,
+        headers=headers
+    )
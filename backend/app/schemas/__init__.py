@@ -64,7 +64,8 @@ from app.schemas.catalysts.support import (
 )
 from app.schemas.catalysts.catalyst import (
     CatalystBase, CatalystCreate, CatalystUpdate,
-    CatalystSimple, CatalystResponse
+    CatalystSimple, CatalystListItem, CatalystResponse,
+    CatalystConsumptionResponse
 )
 from app.schemas.catalysts.sample import (
     SampleBase, SampleCreate, SampleUpdate,
@@ -154,7 +155,8 @@ __all__ = [
     "SupportBase", "SupportCreate", "SupportUpdate", "SupportResponse",
     # Catalysts - Catalyst
     "CatalystBase", "CatalystCreate", "CatalystUpdate",
-    "CatalystSimple", "CatalystResponse",
+    "CatalystSimple", "CatalystListItem", "CatalystResponse",
+    "CatalystConsumptionResponse",
     # Catalysts - Sample
     "SampleBase", "SampleCreate", "SampleUpdate",
     "SampleSimple", "SampleResponse",
@@ -244,6 +246,7 @@ def _rebuild_models():
     FileResponse.model_rebuild(_types_namespace=namespace)
 
     # Catalysts domain
+    CatalystListItem.model_rebuild(_types_namespace=namespace)
     CatalystResponse.model_rebuild(_types_namespace=namespace)
     MethodResponse.model_rebuild(_types_namespace=namespace)
     SampleResponse.model_rebuild(_types_namespace=namespace)
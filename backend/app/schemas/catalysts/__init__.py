@@ -51,7 +51,9 @@ from app.schemas.catalysts.catalyst import (
     CatalystCreate,
     CatalystUpdate,
     CatalystSimple,
-    CatalystResponse
+    CatalystListItem,
+    CatalystResponse,
+    CatalystConsumptionResponse
 )
 
 # Sample schemas
@@ -76,7 +78,8 @@ __all__ = [
     "SupportBase", "SupportCreate", "SupportUpdate", "SupportResponse",
     # Catalyst
     "CatalystBase", "CatalystCreate", "CatalystUpdate",
-    "CatalystSimple", "CatalystResponse",
+    "CatalystSimple", "CatalystListItem", "CatalystResponse",
+    "CatalystConsumptionResponse",
     # Sample
     "SampleBase", "SampleCreate", "SampleUpdate",
     "SampleSimple", "SampleResponse",
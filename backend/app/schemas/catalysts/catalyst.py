@@ -23,7 +23,9 @@ from __future__ import annotations
 from pydantic import BaseModel, Field, ConfigDict, model_validator
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional, List, TYPE_CHECKING
+from typing import Any, Optional, List, TYPE_CHECKING
+
+from app.schemas.loading import only_loaded_relationships
 
 if TYPE_CHECKING:
     from app.schemas.catalysts.method import MethodSimple
@@ -180,9 +182,55 @@ class CatalystSimple(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class CatalystListItem(BaseModel):
+    """
+    Lightweight catalyst representation returned by the list endpoint.
+
+    Omits the free-form notes (which grow with every consumption entry)
+    so list queries can leave that column unloaded. Nested relationships
+    behave exactly as in CatalystResponse.
+    """
+
+    id: int = Field(..., description="Unique identifier")
+    name: str = Field(..., description="Catalyst name/identifier")
+    method_id: Optional[int] = Field(None, description="ID of synthesis method")
+    yield_amount: Decimal = Field(..., description="Amount produced (grams)")
+    remaining_amount: Decimal = Field(..., description="Amount remaining (grams)")
+    storage_location: str = Field(..., description="Physical storage location")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+
+    # Computed properties
+    is_depleted: bool = Field(default=False, description="Whether catalyst is fully consumed")
+    usage_percentage: float = Field(default=0.0, description="Percentage of original yield consumed")
+    sample_count: int = Field(default=0, description="Number of samples prepared from this catalyst")
+    characterization_count: int = Field(default=0, description="Number of characterizations performed")
+
+    # Optional nested relationships (included when requested)
+    method: Optional["MethodSimple"] = None
+    input_catalysts: Optional[List["CatalystSimple"]] = None
+    output_catalysts: Optional[List["CatalystSimple"]] = None
+    samples: Optional[List["SampleSimple"]] = None
+    characterizations: Optional[List["CharacterizationSimple"]] = None
+    observations: Optional[List["ObservationSimple"]] = None
+    users: Optional[List["UserSimple"]] = None
+
+    @model_validator(mode='before')
+    @classmethod
+    def skip_unloaded_relationships(cls, data: Any) -> Any:
+        """Hide relationships that were not requested via include."""
+        return only_loaded_relationships(data)
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class CatalystResponse(CatalystBase):
     """
     Complete schema for catalyst data returned by the API.
+
+    Nested relationships are only populated when they were eagerly loaded
+    by the query (see the ``include`` parameter); unloaded relationships
+    serialize as None instead of triggering lazy loads.
     """
 
     id: int = Field(..., description="Unique identifier")
@@ -246,6 +294,12 @@ class CatalystResponse(CatalystBase):
         description="Users who worked on this (included when requested)"
     )
 
+    @model_validator(mode='before')
+    @classmethod
+    def skip_unloaded_relationships(cls, data: Any) -> Any:
+        """Hide relationships that were not requested via include."""
+        return only_loaded_relationships(data)
+
     model_config = ConfigDict(
         from_attributes=True,
         json_schema_extra={
@@ -268,3 +322,17 @@ class CatalystResponse(CatalystBase):
             ]
         }
     )
+
+
+class CatalystConsumptionResponse(BaseModel):
+    """
+    Schema for a catalyst material consumption log entry.
+    """
+
+    id: int = Field(..., description="Log entry ID")
+    catalyst_id: int = Field(..., description="Catalyst the material was taken from")
+    amount: Decimal = Field(..., description="Amount consumed (grams)")
+    notes: Optional[str] = Field(None, description="What the material was used for")
+    consumed_at: datetime = Field(..., description="When the material was consumed")
+
+    model_config = ConfigDict(from_attributes=True)
@@ -16,10 +16,12 @@ create table chemicals (
 );
 """
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 from datetime import datetime
 from typing import Optional, List, Any
 
+from app.schemas.loading import only_loaded_relationships
+
 
 class ChemicalBase(BaseModel):
     """
@@ -101,6 +103,12 @@ class ChemicalResponse(ChemicalBase):
         description="Methods using this chemical (included when requested)"
     )
 
+    @model_validator(mode='before')
+    @classmethod
+    def skip_unloaded_relationships(cls, data: Any) -> Any:
+        """Hide relationships that were not requested via include."""
+        return only_loaded_relationships(data)
+
     model_config = ConfigDict(
         from_attributes=True,
         json_schema_extra={
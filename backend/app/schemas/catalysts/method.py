@@ -17,9 +17,11 @@ Schema Hierarchy:
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 from datetime import datetime
-from typing import Optional, List, TYPE_CHECKING
+from typing import Any, Optional, List, TYPE_CHECKING
+
+from app.schemas.loading import only_loaded_relationships
 
 if TYPE_CHECKING:
     from app.schemas.catalysts.chemical import ChemicalSimple
@@ -139,6 +141,12 @@ class UserMethodResponse(BaseModel):
         description="User details (included when requested)"
     )
 
+    @model_validator(mode='before')
+    @classmethod
+    def skip_unloaded_relationships(cls, data: Any) -> Any:
+        """Hide relationships that were not requested via include."""
+        return only_loaded_relationships(data)
+
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -198,6 +206,12 @@ class MethodResponse(MethodBase):
         description="Modification history (included when requested)"
     )
 
+    @model_validator(mode='before')
+    @classmethod
+    def skip_unloaded_relationships(cls, data: Any) -> Any:
+        """Hide relationships that were not requested via include."""
+        return only_loaded_relationships(data)
+
     model_config = ConfigDict(
         from_attributes=True,
         json_schema_extra={
@@ -30,7 +30,9 @@ from __future__ import annotations
 from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional, List, TYPE_CHECKING
+from typing import Any, Optional, List, TYPE_CHECKING
+
+from app.schemas.loading import only_loaded_relationships
 
 if TYPE_CHECKING:
     from app.schemas.catalysts.catalyst import CatalystSimple
@@ -42,6 +44,10 @@ if TYPE_CHECKING:
     from app.schemas.core.user import UserSimple
 
 
+# Scale of the numeric(8,4) inventory columns
+_AMOUNT_SCALE = Decimal('0.0001')
+
+
 class SampleBase(BaseModel):
     """
     Base schema for samples containing core attributes.
@@ -111,6 +117,17 @@ class SampleBase(BaseModel):
         description="Additional notes about this sample"
     )
 
+    @field_validator('yield_amount', 'remaining_amount')
+    @classmethod
+    def quantize_to_column_scale(cls, v):
+        """
+        Use the numeric(8,4) column scale, so "5" reads back as "5.0000".
+
+        Responses built from a just-flushed row then match those built from
+        a loaded one. decimal_places=4 already rules out rounding.
+        """
+        return v.quantize(_AMOUNT_SCALE)
+
     @field_validator('remaining_amount')
     @classmethod
     def validate_remaining_not_negative(cls, v):
@@ -263,6 +280,12 @@ class SampleResponse(SampleBase):
         description="Users who worked on this sample (included when requested)"
     )
 
+    @model_validator(mode='before')
+    @classmethod
+    def skip_unloaded_relationships(cls, data: Any) -> Any:
+        """Hide relationships that were not requested via include."""
+        return only_loaded_relationships(data)
+
     model_config = ConfigDict(
         from_attributes=True,
         json_schema_extra={
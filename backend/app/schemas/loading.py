@@ -0,0 +1,56 @@
+"""
+Helpers for serializing ORM instances with explicitly loaded relationships.
+
+Response schemas expose relationships as optional nested fields that are
+only "included when requested". Routers declare which relationships to
+load via the ``include`` query parameter and guard everything else with
+``raiseload('*')``, so serialization must never touch a relationship that
+was not loaded - doing so would either raise or silently issue one lazy
+SELECT per row (the classic N+1 problem).
+
+``only_loaded_relationships`` is meant to be used as a ``mode='before'``
+model validator on Response schemas. It hides unloaded relationships from
+Pydantic's attribute lookup, so the corresponding fields simply fall back
+to their ``None`` default.
+"""
+
+from typing import Any
+
+from sqlalchemy import inspect as sa_inspect
+
+
+class _LoadedAttributeProxy:
+    """
+    Read-only view of an ORM instance that hides unloaded relationships.
+
+    Attribute access for a hidden relationship raises AttributeError,
+    which Pydantic's from_attributes mode treats as a missing field.
+    """
+
+    __slots__ = ('_instance', '_hidden')
+
+    def __init__(self, instance: Any, hidden: frozenset):
+        self._instance = instance
+        self._hidden = hidden
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self._hidden:
+            raise AttributeError(name)
+        return getattr(self._instance, name)
+
+
+def only_loaded_relationships(data: Any) -> Any:
+    """
+    Wrap an ORM instance so only already-loaded relationships are visible.
+
+    Non-ORM input (dicts, other models) is returned unchanged.
+    """
+    state = sa_inspect(data, raiseerr=False)
+    if state is None or not hasattr(state, 'unloaded'):
+        return data
+
+    hidden = frozenset(state.unloaded.intersection(state.mapper.relationships.keys()))
+    if not hidden:
+        return data
+
+    return _LoadedAttributeProxy(data, hidden)
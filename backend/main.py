@@ -22,21 +22,57 @@ API Documentation:
 - OpenAPI JSON: http://localhost:8000/openapi.json
 """
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
+from anyio import to_thread
+from sqlalchemy import text
+import hashlib
 import logging
+import os
+from typing import Optional
 
 # Import all routers
 from app.routers import all_routers
-from app.database import engine, Base
+from app.database import engine, Base, count_queries, warm_pool
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# HTTP Caching
+# =============================================================================
+
+# Read endpoints whose GET responses get an ETag for conditional requests
+ETAG_PATH_PREFIXES = (
+    "/api/catalysts", "/api/chemicals", "/api/methods", "/api/samples"
+)
+
+
+def _parse_if_none_match(header: Optional[str]) -> set:
+    """Entity tags listed in an If-None-Match header, weak prefixes dropped."""
+    if not header:
+        return set()
+    return {
+        tag.strip().removeprefix("W/")
+        for tag in header.split(",")
+    }
+
+
+# =============================================================================
+# Worker Threads
+# =============================================================================
+
+# Route handlers are sync and use blocking Session I/O, so FastAPI runs each
+# request in AnyIO's worker thread pool (40 threads by default). Raising this
+# only helps while the database pool (DB_POOL_SIZE + DB_MAX_OVERFLOW) has
+# connections to spare; extra threads would just wait for one.
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "40"))
+
+
 # =============================================================================
 # Application Lifespan
 # =============================================================================
@@ -47,17 +83,19 @@ async def lifespan(app: FastAPI):
     Application lifespan manager.
     
     Handles startup and shutdown events:
-    - Startup: Database connection verification, table creation (dev only)
+    - Startup: Worker thread limit, database connection verification and
+      pool warm-up, table creation (dev only)
     - Shutdown: Cleanup resources
     """
 
     # Startup
     logger.info("Starting application...")
 
-    # Verify database connection
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
+    # Verify database connection and open the pooled connections up front
     try:
-        with engine.connect() as conn:
-            conn.execute("SELECT 1")
+        warm_pool()
         logger.info("Database connection verified")
     except Exception as e:
         logger.error(f"Database connection failed: {e}")
@@ -176,8 +214,68 @@ The API uses standard HTTP status codes:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # Let the browser read pagination cursors from list responses
+        expose_headers=["X-Next-Cursor", "ETag"],
     )
 
+    # =========================================================================
+    # Query Count Logging
+    # =========================================================================
+
+    # Opt-in guard against N+1 regressions: when SQL_QUERY_WARN_THRESHOLD is
+    # set, requests that issue more statements than that are logged
+    query_warn_threshold = int(os.getenv("SQL_QUERY_WARN_THRESHOLD", "0"))
+
+    if query_warn_threshold > 0:
+        @app.middleware("http")
+        async def log_query_count(request: Request, call_next):
+            with count_queries() as queries:
+                response = await call_next(request)
+            if len(queries) > query_warn_threshold:
+                logger.warning(
+                    f"{request.method} {request.url.path} issued "
+                    f"{len(queries)} SQL statements"
+                )
+            return response
+
+    # =========================================================================
+    # Conditional GET (ETag)
+    # =========================================================================
+
+    # Successful GETs under these prefixes carry an ETag derived from the
+    # response body. Clients revalidate with If-None-Match and get an empty
+    # 304 when nothing changed. The ETag is recomputed on every request, so
+    # it can never go stale, whichever router changed the underlying rows.
+    @app.middleware("http")
+    async def add_etag(request: Request, call_next):
+        response = await call_next(request)
+
+        if (
+                request.method != "GET"
+                or response.status_code != 200
+                or not request.url.path.startswith(ETAG_PATH_PREFIXES)
+        ):
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+        headers = dict(response.headers)
+        headers["ETag"] = etag
+        headers["Cache-Control"] = "no-cache"
+
+        if etag in _parse_if_none_match(request.headers.get("if-none-match")):
+            headers.pop("content-length", None)
+            headers.pop("content-type", None)
+            return Response(status_code=304, headers=headers)
+
+        return Response(
+            content=body,
+            status_code=response.status_code,
+            headers=headers,
+            media_type=response.media_type
+        )
+
     # =========================================================================
     # Register Routers
     # =========================================================================
@@ -222,14 +320,17 @@ The API uses standard HTTP status codes:
         }
 
     @app.get("/health", tags=["Root"])
-    async def health_check():
+    def health_check():
         """
         Health check endpoint for monitoring.
+
+        Declared sync so the blocking connectivity check runs in a worker
+        thread instead of stalling the event loop.
         """
         # Check database connectivity
         try:
             with engine.connect() as conn:
-                conn.execute("SELECT 1")
+                conn.execute(text("SELECT 1"))
             db_status = "healthy"
         except Exception as e:
             db_status = f"unhealthy: {str(e)}"
@@ -0,0 +1,129 @@
+"""
+Shared fixtures for the backend test suite.
+
+The tests run against a real PostgreSQL database, because the schema
+relies on PostgreSQL-only features (JSONB, pg_trgm indexes,
+ON CONFLICT). Point DATABASE_URL at a disposable database initialised
+with database/init/01_init.sql, then run ``pytest`` from backend/.
+Without such a URL every test that needs the database is skipped.
+
+Each test runs inside one outer transaction that is rolled back at the
+end. Sessions join it with savepoints, so endpoint commits never
+persist anything.
+
+Fixtures:
+- client: TestClient whose get_db dependency uses the test transaction
+- db: Session for seeding data inside the same transaction
+- count_app_queries: context manager collecting the SQL statements the
+  application issued inside the block
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+
+# Make the backend package (main, app) importable when running pytest
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+DATABASE_URL = os.getenv("DATABASE_URL", "")
+
+# Savepoint bookkeeping issued for the per-test transaction, not by the
+# application code under test
+_SAVEPOINT_PREFIXES = ('SAVEPOINT', 'RELEASE SAVEPOINT', 'ROLLBACK TO SAVEPOINT')
+
+
+@pytest.fixture(scope="session")
+def fastapi_app():
+    """The FastAPI application, or skip when no PostgreSQL URL is set."""
+    if not DATABASE_URL.startswith("postgresql"):
+        pytest.skip("DATABASE_URL does not point at a PostgreSQL test database")
+
+    import main
+    return main.app
+
+
+@pytest.fixture
+def connection(fastapi_app):
+    """Connection holding the outer transaction rolled back after each test."""
+    from app.database import engine
+
+    conn = engine.connect()
+    transaction = conn.begin()
+    try:
+        yield conn
+    finally:
+        transaction.rollback()
+        conn.close()
+
+
+def _test_session(connection):
+    """Session whose commits release a savepoint inside the test transaction."""
+    from sqlalchemy.orm import Session
+
+    return Session(
+        bind=connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint"
+    )
+
+
+@pytest.fixture
+def db(connection):
+    """Session for seeding test data."""
+    session = _test_session(connection)
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(fastapi_app, connection):
+    """TestClient whose requests run inside the test transaction."""
+    from fastapi.testclient import TestClient
+    from app.database import get_db
+
+    def override_get_db():
+        session = _test_session(connection)
+        try:
+            yield session
+        finally:
+            session.close()
+
+    fastapi_app.dependency_overrides[get_db] = override_get_db
+    try:
+        yield TestClient(fastapi_app)
+    finally:
+        fastapi_app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture
+def count_app_queries():
+    """
+    Collect the statements the application issues inside a block.
+
+    Usage:
+        with count_app_queries() as queries:
+            client.get("/api/catalysts/?include=method")
+        assert len(queries) <= 2
+
+    The list is filled when the block exits; savepoint statements from the
+    test transaction are left out so bounds match production behaviour.
+    """
+    from app.database import count_queries
+
+    @contextmanager
+    def counter() -> Iterator[List[str]]:
+        statements: List[str] = []
+        with count_queries() as queries:
+            yield statements
+        statements.extend(
+            query for query in queries
+            if not query.lstrip().upper().startswith(_SAVEPOINT_PREFIXES)
+        )
+
+    return counter
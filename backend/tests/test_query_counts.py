@@ -0,0 +1,100 @@
+"""
+Query-count regression tests for the catalyst endpoints.
+
+The include handling is the part that silently turns into N+1 queries
+when a relationship or column is added without its loader option. These
+tests pin an upper bound on the statements each endpoint issues, so
+such a regression fails here instead of in production.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from app.models.catalysts.catalyst import Catalyst, catalyst_catalyst
+from app.models.catalysts.method import Method
+
+# Number of catalysts seeded for the list test
+SEEDED_CATALYSTS = 50
+
+INCLUDE = "method,input_catalysts,output_catalysts"
+
+
+@pytest.fixture
+def catalysts(db):
+    """Seed one method and a chain of catalysts, each made from the previous."""
+    method = Method(descriptive_name="Impregnation", procedure="Wet impregnation")
+    db.add(method)
+    db.flush()
+    method_id = method.id
+
+    rows = [
+        Catalyst(
+            name=f"Pt/Al2O3 #{index}",
+            method_id=method_id,
+            yield_amount=Decimal("5.0000"),
+            remaining_amount=Decimal("5.0000"),
+            storage_location="Shelf A"
+        )
+        for index in range(SEEDED_CATALYSTS)
+    ]
+    db.add_all(rows)
+    db.flush()
+
+    db.execute(
+        catalyst_catalyst.insert(),
+        [
+            {'input_catalyst_id': previous.id, 'output_catalyst_id': current.id}
+            for previous, current in zip(rows, rows[1:])
+        ]
+    )
+    catalyst_ids = [row.id for row in rows]
+    db.commit()
+
+    return method_id, catalyst_ids
+
+
+def test_list_catalysts_is_3_queries(client, catalysts, count_app_queries):
+    # One SELECT for the catalysts with the method joined in, plus one
+    # SELECT ... IN per included collection
+    with count_app_queries() as queries:
+        response = client.get("/api/catalysts/", params={"include": INCLUDE})
+
+    assert response.status_code == 200
+    assert len(response.json()) == SEEDED_CATALYSTS
+    assert len(queries) <= 3, queries
+
+
+def test_get_catalyst_is_3_queries(client, catalysts, count_app_queries):
+    _, catalyst_ids = catalysts
+
+    with count_app_queries() as queries:
+        response = client.get(
+            f"/api/catalysts/{catalyst_ids[1]}", params={"include": INCLUDE}
+        )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item['id'] for item in body['input_catalysts']] == [catalyst_ids[0]]
+    assert [item['id'] for item in body['output_catalysts']] == [catalyst_ids[2]]
+    assert len(queries) <= 3, queries
+
+
+def test_create_catalyst_is_4_queries(client, catalysts, count_app_queries):
+    # Reference validation, INSERT ... RETURNING, junction insert and the
+    # reload of the response row
+    method_id, catalyst_ids = catalysts
+
+    with count_app_queries() as queries:
+        response = client.post("/api/catalysts/", json={
+            "name": "Pt/Al2O3 calcined",
+            "method_id": method_id,
+            "yield_amount": "2.5",
+            "remaining_amount": "2.5",
+            "storage_location": "Shelf B",
+            "input_catalyst_ids": catalyst_ids[:2]
+        })
+
+    assert response.status_code == 201
+    assert response.json()['method_id'] == method_id
+    assert len(queries) <= 4, queries
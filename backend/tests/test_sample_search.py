@@ -0,0 +1,54 @@
+"""
+Name search on the sample list.
+
+The search term is user input that ends up in a LIKE pattern, so these
+tests pin that blank terms are ignored and that LIKE metacharacters are
+matched literally instead of acting as wildcards.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from app.models.catalysts.sample import Sample
+
+SAMPLE_NAMES = ["50%_Pt", "50xPt", "Pd_a", "Pdxa"]
+
+
+@pytest.fixture
+def samples(db):
+    """Seed samples whose names differ only where a wildcard would match."""
+    db.add_all([
+        Sample(
+            name=name,
+            yield_amount=Decimal("1.0000"),
+            remaining_amount=Decimal("1.0000"),
+            storage_location="Shelf A"
+        )
+        for name in SAMPLE_NAMES
+    ])
+    db.commit()
+
+
+def _search(client, term):
+    response = client.get("/api/samples/", params={"search": term})
+    assert response.status_code == 200
+    return sorted(item['name'] for item in response.json())
+
+
+@pytest.mark.parametrize("term", ["", " ", "   "])
+def test_blank_search_is_ignored(client, samples, term):
+    assert _search(client, term) == sorted(SAMPLE_NAMES)
+
+
+def test_percent_is_matched_literally(client, samples):
+    assert _search(client, "50%") == ["50%_Pt"]
+
+
+def test_underscore_is_matched_literally(client, samples):
+    assert _search(client, "d_") == ["Pd_a"]
+
+
+def test_prefix_search(client, samples):
+    assert _search(client, "pd*") == ["Pd_a", "Pdxa"]
+    assert _search(client, "pd_*") == ["Pd_a"]
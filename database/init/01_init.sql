@@ -1,3 +1,6 @@
+-- trigram matching for substring (ILIKE '%term%') search on name columns
+create extension if not exists pg_trgm;
+
 create table users (
     id serial primary key,
     username varchar(100) unique not null,
@@ -75,6 +78,16 @@ create table methods (
      is_active boolean not null default true
 );
 
+-- matches the list ordering so keyset pagination reads the index directly
+create index idx_methods_created_at_id on methods (created_at desc, id desc);
+
+-- same ordering behind the is_active filter (list_methods?is_active=...)
+create index idx_methods_active_created_at_id on methods (is_active, created_at desc, id desc);
+
+-- trigram indexes so search (ILIKE '%term%' on name or procedure) avoids a sequential scan
+create index idx_methods_descriptive_name_trgm on methods using gin (descriptive_name gin_trgm_ops);
+create index idx_methods_procedure_trgm on methods using gin (procedure gin_trgm_ops);
+
 create table catalysts (
     id serial primary key,
     name varchar(255) not null,
@@ -84,9 +97,22 @@ create table catalysts (
     storage_location varchar(255) not null,
     notes text,
     updated_at timestamp with time zone default current_timestamp not null,
-    created_at timestamp with time zone default current_timestamp not null
+    created_at timestamp with time zone default current_timestamp not null,
+    constraint check_catalyst_remaining_within_yield check (remaining_amount <= yield)
 );
 
+-- trigram index so name search (ILIKE '%term%') avoids a sequential scan
+create index idx_catalysts_name_trgm on catalysts using gin (name gin_trgm_ops);
+
+-- btree on lower(name) serves prefix search (lower(name) LIKE 'term%') as a range scan
+create index idx_catalysts_name_lower_prefix on catalysts (lower(name) text_pattern_ops);
+
+-- matches the list ordering so keyset pagination reads the index directly
+create index idx_catalysts_created_at_id on catalysts (created_at desc, id desc);
+
+-- serves the per-method catalyst count (Method.catalyst_count)
+create index ix_catalysts_method_id on catalysts(method_id);
+
 create table supports (
     id serial primary key,
     descriptive_name varchar(255) not null unique,
@@ -96,6 +122,10 @@ create table supports (
     
 );
 
+-- trigram indexes so search (ILIKE '%term%' on name or description) avoids a sequential scan
+create index idx_supports_descriptive_name_trgm on supports using gin (descriptive_name gin_trgm_ops);
+create index idx_supports_description_trgm on supports using gin (description gin_trgm_ops);
+
 create table samples (
     id serial primary key,
     name varchar(255),
@@ -111,6 +141,23 @@ create table samples (
     
 );
 
+-- matches the list ordering so keyset pagination reads the index directly
+create index idx_samples_created_at_id on samples (created_at desc, id desc);
+
+-- filtered sample lists (newest first) read these in order instead of
+-- sorting; the leading column also serves the per-parent sample counts
+create index idx_samples_catalyst_created_at_id on samples (catalyst_id, created_at desc, id desc);
+create index idx_samples_support_created_at_id on samples (support_id, created_at desc, id desc);
+create index idx_samples_method_created_at_id on samples (method_id, created_at desc, id desc);
+
+-- depleted=false is the common list filter; only available samples are indexed
+create index idx_samples_available_created_at_id on samples (created_at desc, id desc)
+    where remaining_amount > 0.0001;
+
+-- name search: trigram index for ILIKE '%term%', lower(name) btree for prefix search
+create index idx_samples_name_trgm on samples using gin (name gin_trgm_ops);
+create index idx_samples_name_lower_prefix on samples (lower(name) text_pattern_ops);
+
 create table chemicals (
     id serial primary key,
     name varchar(50) not null unique,
@@ -118,6 +165,15 @@ create table chemicals (
     created_at timestamp with time zone default current_timestamp not null
 );
 
+-- trigram index so name search (ILIKE '%term%') avoids a sequential scan
+create index idx_chemicals_name_trgm on chemicals using gin (name gin_trgm_ops);
+
+-- btree on lower(name) serves prefix search (lower(name) LIKE 'term%') as a range scan
+create index idx_chemicals_name_lower_prefix on chemicals (lower(name) text_pattern_ops);
+
+-- names are unique regardless of case and surrounding whitespace
+create unique index idx_chemicals_name_normalized_unique on chemicals (lower(trim(name)));
+
 
 create table characterizations (
     id serial primary key,
@@ -231,6 +287,9 @@ create table chemical_method (
     primary key(method_id, chemical_id)
 );
 
+-- the primary key leads with method_id; lookups by chemical need their own index
+create index idx_chemical_method_chemical_id on chemical_method(chemical_id);
+
 create table catalyst_characterization (
     catalyst_id integer not null references catalysts(id) on delete cascade,
     characterization_id integer not null references characterizations(id) on delete cascade,
@@ -286,6 +345,22 @@ create table user_method (
     change_notes text
 );
 
+-- a method's history newest first, for keyset pagination on (changed_at, id);
+-- its method_id prefix also serves Method.modification_count
+create index idx_user_method_method_changed_at_id on user_method (method_id, changed_at desc, id desc);
+
+-- append-only log of material consumed from each catalyst
+create table catalyst_consumptions (
+    id serial primary key,
+    catalyst_id integer not null references catalysts(id) on delete cascade,
+    amount numeric(8,4) not null check (amount > 0),
+    notes text,
+    consumed_at timestamp with time zone default current_timestamp not null
+);
+
+-- index for listing a catalyst's consumption history, newest first
+create index idx_catalyst_consumptions_catalyst_consumed_at on catalyst_consumptions(catalyst_id, consumed_at);
+
 create table catalyst_catalyst (
    input_catalyst_id integer not null references catalysts(id) on delete cascade,
    output_catalyst_id integer not null references catalysts(id) on delete cascade,
@@ -58,7 +58,7 @@ export const SampleDetailPage: React.FC = () => {
     // Fetch sample with all relationships
     const { data: sample, isLoading, error } = useSample(
         sampleId,
-        'catalyst,support,method,created_by,characterizations,observations,users'
+        'catalyst,support,method,characterizations,observations,users'
     );
 
     // Fetch available items for relationship management
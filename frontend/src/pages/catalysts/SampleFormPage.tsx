@@ -28,7 +28,7 @@ export const SampleFormPage: React.FC = () => {
     // Fetch existing sample if editing
     const { data: sample, isLoading: isLoadingSample } = useSample(
         id ? parseInt(id) : undefined,
-        'catalyst,support,method,created_by'
+        'catalyst,support,method'
     );
 
     // Fetch dropdown data
@@ -24,7 +24,7 @@ export const SampleListPage: React.FC = () => {
         support_id: supportId,
         method_id: methodId,
         depleted,
-        include: 'catalyst,support,method,created_by',
+        include: 'catalyst,support,method',
     });
 
     const { sortedData, requestSort, getSortDirection } = useSortableData(samples, { key: 'name', direction: 'asc' });
@@ -27,7 +27,7 @@ export const list = async (params?: SampleListParams): Promise<Sample[]> => {
 /**
  * Fetch a single sample by ID with optional relationship inclusion.
  *
- * Include options: catalyst, support, method, created_by, characterizations, observations, users
+ * Include options: catalyst, support, method, characterizations, observations, experiments, users
  */
 export const get = async (id: number, include?: string): Promise<Sample> => {
     const params = include ? { include } : undefined;